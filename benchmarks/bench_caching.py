@@ -0,0 +1,39 @@
+import enum
+import timeit
+from dataclasses import dataclass
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import PayloadCache, Tracing
+
+
+class Region(enum.Enum):
+    EU = "eu"
+    US = "us"
+
+
+@dataclass(frozen=True)
+class Config:
+    endpoint: str
+    retries: int
+    timeout: float
+    hosts: tuple
+    region: Region
+
+
+CONFIG = Config("https://example.com", 3, 2.5, tuple(f"host-{i}" for i in range(20)), Region.EU)
+
+
+def handler(config, region, attempt):
+    pass
+
+
+if __name__ == "__main__":
+    number = 20_000
+    tracer = MockTracer()
+    for name, cache in (("no cache", None), ("PayloadCache", PayloadCache())):
+        traced = Tracing(tracer, payload_cache=cache).trace("Benchmark", handler, tag_parameters=True)
+        seconds = min(timeit.repeat(lambda: traced(CONFIG, Region.US, 1), number=number, repeat=5))
+        tracer.reset()
+        stats = f"hits={cache.hits} misses={cache.misses} bytes={cache.size_bytes}" if cache is not None else ""
+        print(f"{name:<14} {seconds / number * 1e9:>10,.0f} ns/call  {stats}")
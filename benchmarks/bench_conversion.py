@@ -0,0 +1,24 @@
+import json
+import timeit
+import uuid
+
+from opentracing_decorator.conversion import safe_convert
+
+
+def json_round_trip(value):
+    return json.loads(json.dumps(value, default=str))
+
+
+def payload(width: int = 10, depth: int = 2):
+    if depth == 0:
+        return {f"key_{i}": (i, str(i), i / 2, None, True, [i, uuid.UUID(int=i)])[i % 6] for i in range(width)}
+    return {f"key_{i}": payload(width, depth - 1) for i in range(width)}
+
+
+if __name__ == "__main__":
+    value = payload()
+    number = 200
+    for name, convert in (("json round trip", json_round_trip), ("safe_convert", safe_convert)):
+        assert convert(value) == json_round_trip(value)
+        seconds = min(timeit.repeat(lambda: convert(value), number=number))
+        print(f"{name:<20} {seconds / number * 1e3:>8.2f} ms/payload")
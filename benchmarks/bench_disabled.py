@@ -0,0 +1,44 @@
+"""
+Compare calls to a decorated function while tracing is disabled against the
+undecorated function. "disabled" checks the flag on every call, "removed"
+was decorated with `remove_when_disabled=True` and is the original function.
+"""
+
+import timeit
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import Tracing
+
+
+def empty(payload):
+    return payload
+
+
+def work(payload):
+    return sorted(payload)
+
+
+PAYLOADS = {empty: 42, work: list(range(200, 0, -1))}
+
+
+if __name__ == "__main__":
+    number = 200_000
+    tracer = MockTracer()
+    disabled = Tracing(tracer, enabled=False)
+    removed = Tracing(tracer, enabled=False, remove_when_disabled=True)
+    for target, payload in PAYLOADS.items():
+        functions = {
+            "undecorated": target,
+            "disabled": disabled.trace("Benchmark", target, tag_parameters=True, log_return=True),
+            "removed": removed.trace("Benchmark", target, tag_parameters=True, log_return=True),
+        }
+        baseline = 0.0
+        for name, func in functions.items():
+            seconds = min(timeit.repeat(lambda: func(payload), number=number, repeat=7))
+            nanoseconds = seconds / number * 1e9
+            baseline = baseline or nanoseconds
+            print(
+                f"{target.__name__:<6} {name:<12} {nanoseconds:>8.1f} ns/call "
+                f"{nanoseconds - baseline:>+8.1f} ns {nanoseconds / baseline - 1:>+8.1%}"
+            )
@@ -0,0 +1,47 @@
+import timeit
+import traceback
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import Tracing
+from opentracing_decorator.errors import StackFormatter
+
+
+def fail(depth):
+    if depth:
+        fail(depth - 1)
+    raise ValueError("failed")
+
+
+def caught():
+    try:
+        fail(15)
+    except ValueError as error:
+        return error
+
+
+def format_every_time(error):
+    return "".join(traceback.format_tb(error.__traceback__))
+
+
+def call_traced(func):
+    try:
+        func(15)
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    number = 20_000
+    stacks = StackFormatter()
+    error = caught()
+    for name, format_stack in (("traceback.format_tb", format_every_time), ("StackFormatter", stacks.format)):
+        seconds = min(timeit.repeat(lambda: format_stack(error), number=number, repeat=5))
+        print(f"{name:<30} {seconds / number * 1e9:>10,.0f} ns/stack")
+
+    tracer = MockTracer()
+    for name, tracing in (("tracer default", Tracing(tracer, record_exceptions=False)), ("recorded", Tracing(tracer))):
+        traced = tracing.trace("Benchmark", fail)
+        seconds = min(timeit.repeat(lambda: call_traced(traced), number=number // 10, repeat=5))
+        tracer.reset()
+        print(f"{'failing call, ' + name:<30} {seconds / (number // 10) * 1e9:>10,.0f} ns/call")
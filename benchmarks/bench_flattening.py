@@ -0,0 +1,51 @@
+import timeit
+import tracemalloc
+
+from flatten_dict import flatten as flatten_dict
+
+from opentracing_decorator.flattening import flatten
+
+
+def reference(value, reducer):
+    return flatten_dict(value, reducer=reducer, enumerate_types=(list,))
+
+
+def builtin(value, reducer):
+    return flatten(value, reducer)[0]
+
+
+def deep(depth: int = 50, width: int = 4):
+    value = {"leaf": 1}
+    for level in range(depth):
+        value = {f"level_{level}": value, **{f"key_{i}": i for i in range(width)}}
+    return value
+
+
+PAYLOADS = {
+    "wide": {"x": {f"key_{i}": [i, str(i)] for i in range(2000)}},
+    "deep": {"x": deep()},
+}
+
+
+def peak_bytes(func, value, reducer):
+    tracemalloc.start()
+    try:
+        func(value, reducer)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    number = 50
+    for payload_name, value in PAYLOADS.items():
+        for reducer in ("dot", "underscore", "path"):
+            if reducer == "path" and payload_name == "wide":
+                continue
+            assert builtin(value, reducer) == reference(value, reducer)
+            for name, func in (("flatten_dict", reference), ("built-in", builtin)):
+                seconds = min(timeit.repeat(lambda: func(value, reducer), number=number, repeat=5))
+                print(
+                    f"{payload_name:<5} {reducer:<10} {name:<12} {seconds / number * 1e6:>9.0f} us/payload "
+                    f"{peak_bytes(func, value, reducer):>10,} peak bytes"
+                )
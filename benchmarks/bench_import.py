@@ -0,0 +1,67 @@
+"""
+Measure what importing the package and decorating a function costs a fresh
+interpreter, using `python -X importtime`. Only imports that a bare
+interpreter doesn't already make are counted. Exits with status 1 when the
+best of `--repeat` runs is over `--budget-ms`, so it can gate CI.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SCRIPT = """
+from opentracing_decorator import Tracing
+
+tracing = Tracing()
+
+
+@tracing.trace("Startup")
+def handler(event):
+    return event
+
+
+handler(None)
+"""
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(code: str) -> List[Tuple[str, int, int, int]]:
+    """
+    (module, self us, cumulative us, depth) for every import `code` makes.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            own, cumulative, indent, module = match.groups()
+            times.append((module, int(own), int(cumulative), len(indent) // 2))
+    return times
+
+
+def startup_cost(code: str, baseline: set) -> Tuple[int, Dict[str, int]]:
+    times = [entry for entry in import_times(code) if entry[0] not in baseline]
+    total = sum(cumulative for _, _, cumulative, depth in times if depth == 0)
+    return total, {module: own for module, own, _, _ in times}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=30.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    baseline = {module for module, _, _, _ in import_times("pass")}
+    total, modules = min(startup_cost(SCRIPT, baseline) for _ in range(arguments.repeat))
+
+    for module, own in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:15]:
+        print(f"{module:<40} {own / 1000:>8.2f} ms")
+    print(f"{'total':<40} {total / 1000:>8.2f} ms (budget {arguments.budget_ms:.2f} ms)")
+    if total / 1000 > arguments.budget_ms:
+        print("over budget", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,25 @@
+import timeit
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import Tracing
+
+
+def target(value):
+    return value
+
+
+if __name__ == "__main__":
+    number = 100_000
+    tracer = MockTracer()
+    tracing = Tracing(tracer)
+    functions = {
+        "undecorated": target,
+        "trace": tracing.trace("Benchmark", target),
+        "measure": tracing.measure("Benchmark", target),
+    }
+    for name, func in functions.items():
+        seconds = min(timeit.repeat(lambda: func(1), number=number, repeat=5))
+        tracer.reset()
+        print(f"{name:<12} {seconds / number * 1e9:>10,.0f} ns/call")
+    print(tracing.metrics.snapshot()["Benchmark"]["p99_ns"], "ns p99 (measure)")
@@ -0,0 +1,28 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import Tracing
+
+
+def work():
+    pass
+
+
+def fan_out(executor, tasks):
+    started = time.perf_counter_ns()
+    wait([executor.submit(work) for _ in range(tasks)])
+    return time.perf_counter_ns() - started
+
+
+if __name__ == "__main__":
+    tasks = 10_000
+    tracer = MockTracer()
+    tracing = Tracing(tracer)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        traced = tracing.traced_executor(pool)
+        with tracer.start_active_span("Parent"):
+            for name, executor in (("ThreadPoolExecutor", pool), ("traced_executor", traced)):
+                elapsed = min(fan_out(executor, tasks) for _ in range(5))
+                print(f"{name:<20} {elapsed / tasks:>8.0f} ns/task")
@@ -0,0 +1,72 @@
+"""
+Compare the cost of activating and closing a scope with each scope manager,
+then run thousands of interleaved asyncio tasks through traced functions
+and check that every child span has the right parent.
+"""
+
+import asyncio
+import time
+import timeit
+
+from opentracing.mocktracer import MockTracer
+from opentracing.scope_managers import ThreadLocalScopeManager
+from opentracing.scope_managers.asyncio import AsyncioScopeManager
+from opentracing.scope_managers.contextvars import ContextVarsScopeManager
+
+from opentracing_decorator import ContextVarScopeManager, Tracing
+
+SCOPE_MANAGERS = {
+    "thread local": ThreadLocalScopeManager,
+    "asyncio": AsyncioScopeManager,
+    "opentracing contextvars": ContextVarsScopeManager,
+    "ContextVarScopeManager": ContextVarScopeManager,
+}
+
+
+def activation_cost(scope_manager, number: int) -> float:
+    span = MockTracer().start_span("Benchmark")
+
+    def activate_and_close():
+        scope_manager.activate(span, False).close()
+
+    async def in_task():
+        return min(timeit.repeat(activate_and_close, number=number, repeat=5))
+
+    # The asyncio scope manager keeps the scope on the current task.
+    return asyncio.run(in_task()) / number * 1e9
+
+
+def stress(tasks: int) -> float:
+    tracer = MockTracer()
+    tracing = Tracing(tracer, scope_manager=ContextVarScopeManager())
+
+    @tracing.trace("Child")
+    async def child():
+        await asyncio.sleep(0)
+
+    @tracing.trace("Parent")
+    async def parent():
+        await asyncio.sleep(0)
+        await child()
+        await child()
+
+    async def main():
+        await asyncio.gather(*(parent() for _ in range(tasks)))
+
+    started = time.perf_counter_ns()
+    asyncio.run(main())
+    elapsed = time.perf_counter_ns() - started
+
+    spans = tracer.finished_spans()
+    parents = {span.context.span_id for span in spans if span.operation_name == "Parent"}
+    children = [span for span in spans if span.operation_name == "Child"]
+    assert len(parents) == tasks and len(children) == 2 * tasks
+    assert all(span.parent_id in parents for span in children)
+    return elapsed / len(spans)
+
+
+if __name__ == "__main__":
+    for name, scope_manager in SCOPE_MANAGERS.items():
+        print(f"{name:<26} {activation_cost(scope_manager(), 100_000):>8,.0f} ns per activate and close")
+    tasks = 5000
+    print(f"{tasks} interleaved tasks, parents correct, {stress(tasks):,.0f} ns per traced call")
@@ -0,0 +1,178 @@
+"""
+Measure the per-call overhead of `Tracing.trace` for each option combination.
+
+Every decorated function runs against `opentracing.mocktracer.MockTracer`, so
+no collector or network is involved. Results can be saved as JSON and
+compared against an earlier run:
+
+    python benchmarks/bench_trace.py --output before.json
+    python benchmarks/bench_trace.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import TraceOptions, Tracing
+
+
+def nested(depth: int) -> Dict[str, Any]:
+    value: Dict[str, Any] = {"leaf": 1}
+    for level in range(depth):
+        value = {f"level_{level}": value, "value": level}
+    return value
+
+
+PAYLOADS: Dict[str, Any] = {
+    "scalar": 42,
+    "flat": {f"key_{i}": i for i in range(10)},
+    "wide": {f"key_{i}": str(i) for i in range(1000)},
+    "nested": nested(8),
+    "list": {"rows": [{"id": i, "name": str(i)} for i in range(100)]},
+}
+
+OPTIONS: Dict[str, Optional[Dict[str, Any]]] = {
+    "undecorated": None,
+    "plain": {},
+    "pass_span": {"pass_span": True},
+    "tag_parameters": {"tag_parameters": True},
+    "tag_parameters_at_start": {"tag_parameters": True, "tags_at_start": True},
+    "tag_parameters_selected": {"tag_parameters": ["payload.key_1", "payload.rows.0.id"]},
+    "tag_parameters_no_flatten": {"tag_parameters": True, "flatten_parameters": False},
+    "tag_parameters_underscore": {"tag_parameters": True, "parameter_reducer": "underscore"},
+    "tag_parameters_path": {"tag_parameters": True, "parameter_reducer": "path"},
+    "templated_name": {"operation_name": "Benchmark:{payload.key_1}"},
+    "log_return": {"log_return": True},
+    "log_return_no_flatten": {"log_return": True, "flatten_return": False},
+    "tag_parameters_log_return": {"tag_parameters": True, "log_return": True},
+    "shared_options": {"options": TraceOptions(tag_parameters=True, log_return=True)},
+    "tail_capture": {"tag_parameters": True, "log_return": True, "capture_threshold": 1.0},
+}
+
+
+def target(payload: Any, span: Any = None) -> Any:
+    return payload
+
+
+def build(tracing: Tracing, options: Optional[Dict[str, Any]]) -> Callable:
+    if options is None:
+        return target
+    options = dict(options)
+    return tracing.trace(options.pop("operation_name", "Benchmark"), target, **options)
+
+
+def time_per_call(func: Callable, payload: Any, tracer: MockTracer, number: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        tracer.reset()
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            func(payload)
+        best = min(best, (time.perf_counter_ns() - started) / number)
+    tracer.reset()
+    return best
+
+
+def memory_per_call(func: Callable, payload: Any, tracer: MockTracer, number: int) -> Tuple[int, int]:
+    peaks, retained = [], []
+    for _ in range(number):
+        tracemalloc.start()
+        try:
+            func(payload)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peaks.append(peak)
+        retained.append(current)
+    tracer.reset()
+    return int(statistics.median(peaks)), int(statistics.median(retained))
+
+
+def run(number: int, repeat: int, selected: List[str]) -> List[Dict[str, Any]]:
+    tracer = MockTracer()
+    tracing = Tracing(tracer)
+    results = []
+    for payload_name, payload in PAYLOADS.items():
+        for option_name, options in OPTIONS.items():
+            if selected and option_name not in selected:
+                continue
+            func = build(tracing, options)
+            result: Dict[str, Any] = {"payload": payload_name, "options": option_name}
+            try:
+                func(payload)
+            except (TypeError, ValueError) as error:
+                result["error"] = f"{type(error).__name__}: {error}"
+                tracer.reset()
+                results.append(result)
+                continue
+            calls = max(1, number // (100 if payload_name == "wide" else 1))
+            result["ns_per_call"] = round(time_per_call(func, payload, tracer, calls, repeat), 1)
+            result["peak_bytes_per_call"], result["retained_bytes_per_call"] = memory_per_call(
+                func, payload, tracer, 25
+            )
+            results.append(result)
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def report(results: List[Dict[str, Any]], baseline: Optional[List[Dict[str, Any]]] = None) -> None:
+    previous = {(item["payload"], item["options"]): item for item in baseline or []}
+    print(f"{'payload':<8} {'options':<28} {'ns/call':>12} {'peak bytes':>12} {'retained':>10} {'change':>8}")
+    for item in results:
+        if "error" in item:
+            print(f"{item['payload']:<8} {item['options']:<28} {item['error']}")
+            continue
+        change = ""
+        before = previous.get((item["payload"], item["options"]), {}).get("ns_per_call")
+        if before:
+            change = f"{(item['ns_per_call'] - before) / before:+.1%}"
+        print(
+            f"{item['payload']:<8} {item['options']:<28} {item['ns_per_call']:>12,.0f} "
+            f"{item['peak_bytes_per_call']:>12,} {item['retained_bytes_per_call']:>10,} {change:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs, the fastest is kept")
+    parser.add_argument("--options", nargs="*", default=[], choices=list(OPTIONS), help="only run these")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    arguments = parser.parse_args()
+
+    results = run(arguments.number, arguments.repeat, arguments.options)
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf8") as f:
+            baseline = json.load(f)["results"]
+    report(results, baseline)
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
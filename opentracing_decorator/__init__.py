@@ -1,9 +1,56 @@
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .__version__ import __description__, __title__, __version__
-from .tracing import Tracing
 
-__all__ = ["__title__", "__description__", "__version__", "Tracing"]
+if TYPE_CHECKING:
+    from .background import BackgroundSerializer
+    from .caching import PayloadCache
+    from .flattening import FlattenBudget
+    from .limiting import RateLimiter
+    from .options import TraceOptions
+    from .scoping import ContextVarScopeManager
+    from .summarizing import SummarizerRegistry
+    from .tracing import Tracing
+
+__all__ = [
+    "__title__",
+    "__description__",
+    "__version__",
+    "BackgroundSerializer",
+    "ContextVarScopeManager",
+    "FlattenBudget",
+    "PayloadCache",
+    "RateLimiter",
+    "SummarizerRegistry",
+    "TraceOptions",
+    "Tracing",
+]
+
+# Submodules are imported the first time one of their names is used, so
+# importing the package stays cheap for programs that never trace.
+_LAZY = {
+    "BackgroundSerializer": ".background",
+    "ContextVarScopeManager": ".scoping",
+    "FlattenBudget": ".flattening",
+    "PayloadCache": ".caching",
+    "RateLimiter": ".limiting",
+    "SummarizerRegistry": ".summarizing",
+    "TraceOptions": ".options",
+    "Tracing": ".tracing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    value.__module__ = __name__
+    globals()[name] = value
+    return value
+
 
-__locals = locals()
-for __name in __all__:
-    if not __name.startswith("__"):
-        setattr(__locals[__name], "__module__", "opentracing_decorator")  # noqa
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+import opentracing
+
+logger = logging.getLogger(__name__)
+
+DROP = "drop"
+INLINE = "inline"
+BLOCK = "block"
+
+
+def snapshot(value: Any) -> Any:
+    """
+    Take a cheap, shallow snapshot of a payload so it can be serialized later.
+    """
+    if type(value) is dict:
+        return {key: item.copy() if type(item) in (dict, list, set) else item for key, item in value.items()}
+    if type(value) in (list, set):
+        return value.copy()
+    return value
+
+
+class BackgroundSerializer:
+    """
+    Runs tag and log serialization for finished calls on a bounded worker pool.
+
+    Each submitted job holds the payload work for one span and finishes the
+    span once that work is done, so a span is never reported before its tags
+    and logs are attached. At most `max_pending` jobs are queued. When the
+    queue is full, `when_full` decides what happens: "drop" discards the
+    payloads and finishes the span right away, "inline" does the work on the
+    calling thread and "block" waits for a free slot.
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 1024, when_full: str = DROP):
+        if when_full not in (DROP, INLINE, BLOCK):
+            raise ValueError(f"when_full must be one of {DROP!r}, {INLINE!r} or {BLOCK!r}.")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.when_full = when_full
+        self.max_pending = max_pending
+        self.dropped = 0
+        self.inlined = 0
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="opentracing-decorator")
+
+    def submit(
+        self,
+        span: opentracing.Span,
+        payloads: List[Callable[[], None]],
+        finish_time: Optional[float] = None,
+    ) -> None:
+        if finish_time is None:
+            finish_time = time.time()
+        if not payloads:
+            span.finish(finish_time=finish_time)
+            return
+
+        queued = True
+        with self._condition:
+            if self._pending >= self.max_pending:
+                if self.when_full == DROP:
+                    self.dropped += 1
+                    queued, payloads = False, []
+                elif self.when_full == INLINE:
+                    self.inlined += 1
+                    queued = False
+                else:
+                    self._condition.wait_for(lambda: self._pending < self.max_pending)
+            if queued:
+                self._pending += 1
+
+        if queued:
+            self._executor.submit(self._run_queued, span, payloads, finish_time)
+        else:
+            self._run(span, payloads, finish_time)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run_queued(self, span: opentracing.Span, payloads: List[Callable[[], None]], finish_time: float) -> None:
+        try:
+            self._run(span, payloads, finish_time)
+        finally:
+            with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+
+    def _run(self, span: opentracing.Span, payloads: List[Callable[[], None]], finish_time: float) -> None:
+        for payload in payloads:
+            try:
+                payload()
+            except Exception:
+                logger.exception("Failed to serialize a span payload.")
+        span.finish(finish_time=finish_time)
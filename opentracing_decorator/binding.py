@@ -0,0 +1,197 @@
+import inspect
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+_EMPTY = inspect.Parameter.empty
+
+_POSITIONAL = 0
+_VAR_POSITIONAL = 1
+_KEYWORD = 2
+_VAR_KEYWORD = 3
+
+IGNORED_PARAMETERS = frozenset({"self", "cls"})
+
+
+class ParameterBinder:
+    """
+    Maps call arguments to parameter names for a single function.
+
+    The signature is inspected once, when the binder is built. Calling the
+    binder produces the same mapping as `inspect.Signature.bind` followed by
+    `apply_defaults`, without the `self` and `cls` parameters. Ignored
+    parameters are left out without being looked up, so they may be missing.
+    """
+
+    __slots__ = ("_parameters", "_positional", "_keywords", "_var_keyword", "_max_positional")
+
+    def __init__(self, func: Callable, ignored: FrozenSet[str] = IGNORED_PARAMETERS):
+        parameters: List[Tuple[str, int, Any]] = []
+        positional: List[str] = []
+        keywords = set()
+        var_keyword: Optional[str] = None
+        var_positional = False
+
+        for parameter in inspect.signature(func).parameters.values():
+            kind = parameter.kind
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                code = _VAR_POSITIONAL
+                var_positional = True
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                code = _VAR_KEYWORD
+                var_keyword = parameter.name
+            else:
+                code = _KEYWORD
+                if kind is not inspect.Parameter.KEYWORD_ONLY:
+                    code = _POSITIONAL
+                    positional.append(parameter.name)
+                if kind is not inspect.Parameter.POSITIONAL_ONLY:
+                    keywords.add(parameter.name)
+            if parameter.name not in ignored:
+                parameters.append((parameter.name, code, parameter.default))
+
+        self._parameters = tuple(parameters)
+        self._positional = tuple(positional)
+        self._keywords = frozenset(keywords)
+        self._var_keyword = var_keyword
+        self._max_positional = -1 if var_positional else len(positional)
+
+    def __call__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if 0 <= self._max_positional < len(args):
+            raise TypeError("too many positional arguments")
+
+        arguments = dict(zip(self._positional, args))
+        extra: Dict[str, Any] = {}
+        for key, value in kwargs.items():
+            if key in self._keywords:
+                if key in arguments:
+                    raise TypeError(f"multiple values for argument '{key}'")
+                arguments[key] = value
+            elif self._var_keyword is not None:
+                extra[key] = value
+            else:
+                raise TypeError(f"got an unexpected keyword argument '{key}'")
+
+        mapped = {}
+        for name, code, default in self._parameters:
+            if code == _POSITIONAL or code == _KEYWORD:
+                if name in arguments:
+                    value = arguments[name]
+                elif default is not _EMPTY:
+                    value = default
+                else:
+                    raise TypeError(f"missing a required argument: '{name}'")
+            elif code == _VAR_POSITIONAL:
+                value = args[len(self._positional) :]
+            else:
+                value = extra
+            mapped[name] = value
+        return mapped
+
+
+_MISSING = object()
+
+
+def _get_positional(index: int, name: Optional[str], default: Any) -> Callable[[Tuple[Any, ...], Dict[str, Any]], Any]:
+    if name is None:
+        return lambda args, kwargs: args[index] if len(args) > index else default
+    return lambda args, kwargs: args[index] if len(args) > index else kwargs.get(name, default)
+
+
+def _get_keyword(name: str, default: Any) -> Callable[[Tuple[Any, ...], Dict[str, Any]], Any]:
+    return lambda args, kwargs: kwargs.get(name, default)
+
+
+def _get_var_positional(index: int) -> Callable[[Tuple[Any, ...], Dict[str, Any]], Any]:
+    return lambda args, kwargs: args[index:]
+
+
+def _get_var_keyword(keywords: FrozenSet[str]) -> Callable[[Tuple[Any, ...], Dict[str, Any]], Any]:
+    return lambda args, kwargs: {key: value for key, value in kwargs.items() if key not in keywords}
+
+
+def _resolve(value: Any, segments: Tuple[Tuple[str, Optional[int]], ...]) -> Any:
+    for segment, index in segments:
+        try:
+            if type(value) is dict or isinstance(value, Mapping):
+                value = value.get(segment, _MISSING)
+            elif index is not None and isinstance(value, (list, tuple)):
+                value = value[index] if -len(value) <= index < len(value) else _MISSING
+            else:
+                value = getattr(value, segment, _MISSING)
+        except Exception:
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def outermost_paths(paths: Sequence[str]) -> List[str]:
+    """
+    Drop the paths nested under another path in `paths`, whose values would
+    otherwise be flattened into the same keys twice.
+    """
+    unique = list(dict.fromkeys(paths))
+    return [path for path in unique if not any(path.startswith(other + ".") for other in unique)]
+
+
+class ParameterExtractor:
+    """
+    Reads selected parameters, or values nested inside them, straight from
+    the call arguments.
+
+    Each path is a parameter name optionally followed by dotted segments,
+    such as `"user_id"` or `"order.id"`. Segments look up mapping keys,
+    sequence indexes or attributes. The lookups are compiled once, when the
+    extractor is built, and the other arguments are never touched. Paths that
+    cannot be resolved for a call are left out of the result, and paths whose
+    parameter is not in the signature are dropped up front.
+    """
+
+    __slots__ = ("_extractors",)
+
+    def __init__(self, func: Callable, paths: Sequence[str], excluded: FrozenSet[str] = frozenset()):
+        getters: Dict[str, Callable[[Tuple[Any, ...], Dict[str, Any]], Any]] = {}
+        keywords: Set[str] = set()
+        var_keyword = False
+        index = 0
+        for parameter in inspect.signature(func).parameters.values():
+            kind = parameter.kind
+            default = _MISSING if parameter.default is _EMPTY else parameter.default
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                getters[parameter.name] = _get_var_positional(index)
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                var_keyword = True
+                getters[parameter.name] = _get_var_keyword(frozenset(keywords))
+            elif kind is inspect.Parameter.KEYWORD_ONLY:
+                keywords.add(parameter.name)
+                getters[parameter.name] = _get_keyword(parameter.name, default)
+            else:
+                keyword = None if kind is inspect.Parameter.POSITIONAL_ONLY else parameter.name
+                if keyword is not None:
+                    keywords.add(keyword)
+                getters[parameter.name] = _get_positional(index, keyword, default)
+                index += 1
+
+        extractors = []
+        for path in dict.fromkeys(paths):
+            name, *segments = path.split(".")
+            if name in excluded:
+                continue
+            getter = getters.get(name)
+            if getter is None:
+                if not var_keyword:
+                    continue
+                getter = _get_keyword(name, _MISSING)
+            compiled = tuple((segment, int(segment) if segment.lstrip("-").isdigit() else None) for segment in segments)
+            extractors.append((path, getter, compiled))
+        self._extractors = tuple(extractors)
+
+    def __call__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        extracted = {}
+        for path, getter, segments in self._extractors:
+            value = getter(args, kwargs)
+            if segments and value is not _MISSING:
+                value = _resolve(value, segments)
+            if value is not _MISSING:
+                extracted[path] = value
+        return extracted
@@ -0,0 +1,155 @@
+import enum
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+_SCALARS = frozenset({str, int, bool, type(None), bytes})
+
+
+class _Identity:
+    """
+    Keys an immutable object by identity and version. Holding the object
+    keeps its id from being reused while the cache entry lives.
+    """
+
+    __slots__ = ("value", "version", "_hash")
+
+    def __init__(self, value: Any, version: Any):
+        self.value = value
+        self.version = version
+        self._hash = hash((id(value), version))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value and other.version == self.version
+
+
+def _entry_size(payload: Dict[Any, Any]) -> int:
+    size = sys.getsizeof(payload)
+    for key, value in payload.items():
+        size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
+
+
+class PayloadCache:
+    """
+    A bounded LRU cache of flattened and converted tag and log payloads.
+
+    Only payloads built entirely from values that can't change are cached:
+    scalars, enum members, and tuples, frozensets and frozen dataclasses
+    holding only such values, plus instances of `immutable_types`. The first
+    ones are keyed by type and value, `immutable_types` by identity plus their
+    `version_attribute`, when they have one. Entries are evicted least recently used first, once
+    there are more than `max_entries` or their estimated size exceeds
+    `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 1 << 20,
+        immutable_types: Iterable[type] = (),
+        version_attribute: str = "version",
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be at least 1.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.immutable_types = tuple(immutable_types)
+        self.version_attribute = version_attribute
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[Any, Any], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def value_key(self, value: Any) -> Optional[Hashable]:
+        """
+        A cache key standing for `value`, or `None` when it could change and
+        must not be cached.
+
+        Keys hold the type of every value, down through containers, so equal
+        values that serialize differently, like `1` and `True`, get different
+        keys. Floats and complex numbers are keyed by their repr, which tells
+        `0.0` from `-0.0`.
+        """
+        kind = type(value)
+        if kind is float or kind is complex:
+            return (kind, repr(value))
+        if kind in _SCALARS:
+            return (kind, value)
+        if kind is tuple:
+            return self._items_key(kind, value, tuple)
+        if kind is frozenset:
+            return self._items_key(kind, value, frozenset)
+        if isinstance(value, enum.Enum):
+            return (kind, value)
+        if _is_frozen_dataclass(kind):
+            return self._items_key(
+                kind, (getattr(value, name) for name in getattr(kind, "__dataclass_fields__")), tuple
+            )
+        if self.immutable_types and isinstance(value, self.immutable_types):
+            return _Identity(value, getattr(value, self.version_attribute, None))
+        return None
+
+    def _items_key(
+        self, kind: type, items: Iterable[Any], collect: Callable[[Iterable], Hashable]
+    ) -> Optional[Hashable]:
+        keys = []
+        for item in items:
+            key = self.value_key(item)
+            if key is None:
+                return None
+            keys.append(key)
+        return (kind, collect(keys))
+
+    def key(self, options: Hashable, payload: Dict[Any, Any]) -> Optional[Hashable]:
+        keys = [options]
+        for name, value in payload.items():
+            value_key = self.value_key(value)
+            if value_key is None:
+                return None
+            keys.append((name, value_key))
+        return tuple(keys)
+
+    def get(self, key: Hashable) -> Optional[Dict[Any, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, payload: Dict[Any, Any]) -> None:
+        size = _entry_size(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            self._entries[key] = (payload, size)
+            self.size_bytes += size
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+
+def _is_frozen_dataclass(kind: type) -> bool:
+    parameters = getattr(kind, "__dataclass_params__", None)
+    return parameters is not None and parameters.frozen
@@ -0,0 +1,66 @@
+import math
+import re
+from typing import List, Optional, Union
+
+CAPTURE_TAG = "tracing.capture"
+
+SLOW = "slow"
+ERROR = "error"
+
+_PERCENTILE = re.compile(r"p(\d{1,2}(?:\.\d+)?)")
+
+
+class TailCapture:
+    """
+    Decides which calls are slow enough to have their parameters and return
+    value recorded.
+
+    `threshold` is either a duration in seconds or a percentile such as
+    `"p99"`. Percentile thresholds are estimated from the durations of the
+    last `window` calls and recomputed every `refresh_every` calls. Until
+    `min_samples` calls have been seen, no call counts as slow.
+    """
+
+    __slots__ = ("quantile", "window", "min_samples", "refresh_every", "threshold", "_samples", "_count")
+
+    def __init__(
+        self,
+        threshold: Union[float, str],
+        window: int = 1024,
+        min_samples: int = 100,
+        refresh_every: int = 100,
+    ):
+        self.quantile: Optional[float] = None
+        self.window = window
+        self.min_samples = min(min_samples, window)
+        self.refresh_every = refresh_every
+        self._samples: List[float] = []
+        self._count = 0
+        if isinstance(threshold, str):
+            match = _PERCENTILE.fullmatch(threshold)
+            if match is None or not 0 < float(match.group(1)) < 100:
+                raise ValueError(
+                    f"capture threshold must be a number of seconds or a percentile like 'p99', got {threshold!r}."
+                )
+            self.quantile = float(match.group(1)) / 100
+            self.threshold = math.inf
+        elif threshold < 0:
+            raise ValueError("capture threshold must not be negative.")
+        else:
+            self.threshold = float(threshold)
+
+    def is_slow(self, elapsed: float) -> bool:
+        if self.quantile is not None:
+            self._observe(elapsed, self.quantile)
+        return elapsed >= self.threshold
+
+    def _observe(self, elapsed: float, quantile: float) -> None:
+        count = self._count
+        if count < self.window:
+            self._samples.append(elapsed)
+        else:
+            self._samples[count % self.window] = elapsed
+        self._count = count + 1
+        if self._count >= self.min_samples and self._count % self.refresh_every == 0:
+            samples = sorted(self._samples)
+            self.threshold = samples[min(len(samples) - 1, int(quantile * len(samples)))]
@@ -0,0 +1,129 @@
+import math
+from typing import Any, Callable, Dict
+
+_MAX_CACHED_TYPES = 1024
+_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _convert_list(value: Any) -> Any:
+    converters = _converters
+    return [
+        item if type(item) in _PRIMITIVES else (converters.get(type(item)) or _converter(type(item)))(item)
+        for item in value
+    ]
+
+
+def _convert_dict(value: Any) -> Any:
+    converters = _converters
+    return {
+        (key if type(key) is str else _convert_key(key)): (
+            item if type(item) in _PRIMITIVES else (converters.get(type(item)) or _converter(type(item)))(item)
+        )
+        for key, item in value.items()
+    }
+
+
+def _convert_key(key: Any) -> str:
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None:
+        return "null"
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if math.isnan(key):
+            return "NaN"
+        if math.isinf(key):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _resolve(kind: type) -> Callable[[Any], Any]:
+    # Mirrors the type checks json.dumps makes, in the same order.
+    if issubclass(kind, str):
+        return _identity if kind is str else str.__str__
+    if kind is type(None) or kind is bool:
+        return _identity
+    if issubclass(kind, int):
+        return _identity if kind is int else int.__int__
+    if issubclass(kind, float):
+        return _identity if kind is float else float.__float__
+    if issubclass(kind, (list, tuple)):
+        return _convert_list
+    if issubclass(kind, dict):
+        return _convert_dict
+    return str
+
+
+_converters: Dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    list: _convert_list,
+    tuple: _convert_list,
+    dict: _convert_dict,
+}
+
+
+def _converter(kind: type) -> Callable[[Any], Any]:
+    converter = _converters.get(kind)
+    if converter is None:
+        converter = _resolve(kind)
+        if len(_converters) < _MAX_CACHED_TYPES:
+            _converters[kind] = converter
+    return converter
+
+
+def _has_cycle(value: Any) -> bool:
+    """
+    Whether a list, tuple or dict in `value` contains itself, found without
+    recursing.
+    """
+    path = set()
+    stack = [(value, False)]
+    while stack:
+        item, leaving = stack.pop()
+        if leaving:
+            path.discard(id(item))
+            continue
+        if isinstance(item, dict):
+            children: Any = item.values()
+        elif isinstance(item, (list, tuple)):
+            children = item
+        else:
+            continue
+        if id(item) in path:
+            return True
+        path.add(id(item))
+        stack.append((item, True))
+        stack.extend((child, False) for child in children)
+    return False
+
+
+def safe_convert(value: Any) -> Any:
+    """
+    Convert a value into JSON-compatible primitives.
+
+    Produces the same result as `json.loads(json.dumps(value, default=str))`,
+    walking the value once instead of encoding and parsing it. Like `json`, a
+    value that contains itself raises `ValueError`.
+    """
+    try:
+        return _converter(type(value))(value)
+    except RecursionError:
+        # Only looked for once the walk fails, so converting doesn't pay for
+        # tracking the containers it is in.
+        if _has_cycle(value):
+            raise ValueError("Circular reference detected") from None
+        raise
@@ -0,0 +1,70 @@
+import threading
+from types import CodeType, TracebackType
+from typing import Dict, List, Optional, Tuple
+
+import opentracing
+from opentracing import logs, tags
+
+_Key = Tuple[type, Tuple[Tuple[CodeType, int], ...]]
+
+
+class StackFormatter:
+    """
+    Formats the innermost `max_frames` frames of a traceback, caching the
+    result.
+
+    The cache key is the exception type and the code location of every
+    formatted frame, so identical failures repeated under load reuse one
+    string instead of reading source lines again. At most `max_entries`
+    stacks are kept, the oldest is evicted first.
+    """
+
+    def __init__(self, max_frames: int = 20, max_entries: int = 256):
+        if max_frames < 1 or max_entries < 1:
+            raise ValueError("max_frames and max_entries must be at least 1.")
+        self.max_frames = max_frames
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._stacks: Dict[_Key, str] = {}
+        self._lock = threading.Lock()
+
+    def format(self, error: BaseException) -> str:
+        frames: List[Tuple[CodeType, int]] = []
+        tb: Optional[TracebackType] = error.__traceback__
+        while tb is not None:
+            frames.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+        key = (type(error), tuple(frames[-self.max_frames :]))
+
+        stack = self._stacks.get(key)
+        if stack is not None:
+            self.hits += 1
+            return stack
+
+        import traceback
+
+        stack = "".join(traceback.format_list(traceback.extract_tb(error.__traceback__, limit=-self.max_frames)))
+        with self._lock:
+            self.misses += 1
+            if len(self._stacks) >= self.max_entries:
+                del self._stacks[next(iter(self._stacks))]
+            self._stacks[key] = stack
+        return stack
+
+
+def record_exception(span: opentracing.Span, error: BaseException, stacks: StackFormatter) -> None:
+    """
+    Tag `span` as failed and log `error` with the standard OpenTracing
+    error fields, the stack formatted as a string.
+    """
+    span.set_tag(tags.ERROR, True)
+    span.log_kv(
+        {
+            logs.EVENT: tags.ERROR,
+            logs.ERROR_KIND: type(error).__qualname__,
+            logs.ERROR_OBJECT: error,
+            logs.MESSAGE: str(error),
+            logs.STACK: stacks.format(error),
+        }
+    )
@@ -0,0 +1,143 @@
+import itertools
+import os.path
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+TRUNCATED_KEY = "_truncated"
+
+SEPARATORS = {"dot": ".", "underscore": "_"}
+
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+_INDEX_STRINGS = tuple(str(index) for index in range(1024))
+
+
+def _tuple_reducer(parent: Any, key: Any) -> Any:
+    return (key,) if parent is None else parent + (key,)
+
+
+def _path_reducer(parent: Any, key: Any) -> Any:
+    return key if parent is None else os.path.join(parent, key)
+
+
+REDUCERS: Dict[str, Callable[[Any, Any], Any]] = {"tuple": _tuple_reducer, "path": _path_reducer}
+
+
+class FlattenBudget(NamedTuple):
+    """
+    Limits on how much of a payload gets flattened into tags or logs.
+
+    `max_depth` is the number of nesting levels that are walked,
+    `max_keys` the number of flattened keys produced, `max_list_items` the
+    number of elements enumerated per list and `max_string_length` the
+    number of characters kept from string values. `None` means unlimited.
+    """
+
+    max_depth: Optional[int] = None
+    max_keys: Optional[int] = None
+    max_list_items: Optional[int] = None
+    max_string_length: Optional[int] = None
+
+
+_UNLIMITED = FlattenBudget()
+
+
+def flatten(
+    dikt: Dict[Any, Any],
+    reducer: Union[str, Callable[[Any, Any], Any]] = "dot",
+    budget: Optional[FlattenBudget] = None,
+    summarize: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[Dict[Any, Any], bool]:
+    """
+    Flatten nested dicts and lists into a single level dict.
+
+    Produces the same keys, in the same order, as
+    `flatten_dict.flatten(dikt, reducer=reducer, enumerate_types=(list,))`:
+    empty containers are dropped and duplicated keys raise `ValueError`.
+    The walk uses an explicit stack. For the "dot" and "underscore" reducers,
+    the joined prefix of each container is built once and shared by all of
+    its children. When `budget` runs out the walk stops early. `summarize`,
+    when given, may replace any value that isn't a str, number, bool, None or
+    dict before it is walked. A container nested inside itself is skipped,
+    like a budget running out.
+
+    Returns the flattened dict and whether anything was left out.
+    """
+    separator = ""
+    reduce: Optional[Callable[[Any, Any], Any]] = None
+    if isinstance(reducer, str) and reducer in SEPARATORS:
+        separator = SEPARATORS[reducer]
+    else:
+        reduce = REDUCERS[reducer] if isinstance(reducer, str) else reducer
+
+    if budget is None:
+        budget = _UNLIMITED
+    max_depth, max_keys, max_list_items, max_string_length = budget
+
+    flat: Dict[Any, Any] = {}
+    truncated = False
+    # Each frame holds the parent: the prefix to prepend when joining with a
+    # separator, otherwise the parent's flat key for the reducer. `path` has
+    # the ids of the containers on the stack, which their iterators keep alive.
+    stack: List[Tuple[Any, Iterator[Tuple[Any, Any]], int, int]] = [(None, iter(dikt.items()), 1, id(dikt))]
+    path = {id(dikt)}
+    while stack:
+        parent, items, depth, container = stack[-1]
+        for key, value in items:
+            if reduce is not None:
+                flat_key = reduce(parent, key)
+            elif parent is None:
+                flat_key = key
+            elif type(key) is str:
+                flat_key = parent + key
+            elif type(key) is int and 0 <= key < 1024:
+                flat_key = parent + _INDEX_STRINGS[key]
+            else:
+                flat_key = parent + format(key)
+
+            kind = type(value)
+            if summarize is not None and kind is not dict and kind not in _LEAF_TYPES:
+                value = summarize(value)
+                kind = type(value)
+            if kind is dict or kind is list or (kind not in _LEAF_TYPES and isinstance(value, (list, Mapping))):
+                if not value:
+                    continue
+                if (max_depth is not None and depth >= max_depth) or id(value) in path:
+                    truncated = True
+                    continue
+                if kind is list or (kind is not dict and isinstance(value, list)):
+                    if max_list_items is not None and len(value) > max_list_items:
+                        truncated = True
+                        children: Iterator[Tuple[Any, Any]] = enumerate(itertools.islice(value, max_list_items))
+                    else:
+                        children = enumerate(value)
+                else:
+                    children = iter(value.items())
+                if reduce is None and flat_key is not None:
+                    flat_key = (flat_key if type(flat_key) is str else format(flat_key)) + separator
+                stack.append((flat_key, children, depth + 1, id(value)))
+                path.add(id(value))
+                break
+
+            size = len(flat)
+            if max_keys is not None and size >= max_keys:
+                return flat, True
+            if max_string_length is not None and type(value) is str and len(value) > max_string_length:
+                value = value[:max_string_length]
+                truncated = True
+            flat[flat_key] = value
+            if len(flat) == size:
+                raise ValueError(f"duplicated key '{flat_key}'")
+        else:
+            stack.pop()
+            path.discard(container)
+    return flat, truncated
@@ -0,0 +1,85 @@
+import fnmatch
+import inspect
+from types import ModuleType
+from typing import Callable, Optional, Sequence
+
+from .tracing import TRACED_ATTRIBUTE
+
+
+class Instrumentation:
+    """
+    Applies a trace decorator to many callables at once.
+
+    `include` and `exclude` are glob patterns matched against both the
+    attribute name and the qualified name of each callable, so
+    `"get_*"` and `"Service.get_*"` both work. `operation_name` is a
+    template filled with `module`, `qualname` and `name`.
+    """
+
+    def __init__(
+        self,
+        trace: Callable[..., Callable],
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        operation_name: str = "{qualname}",
+    ):
+        self.trace = trace
+        self.include = tuple(include or ())
+        self.exclude = tuple(exclude or ())
+        self.operation_name = operation_name
+
+    def selected(self, name: str, qualname: str) -> bool:
+        if name.startswith("_"):
+            return False
+        if self.include and not self._matches(self.include, name, qualname):
+            return False
+        return not self._matches(self.exclude, name, qualname)
+
+    def wrap(self, func: Callable) -> Callable:
+        if getattr(func, TRACED_ATTRIBUTE, False):
+            return func
+        operation_name = self.operation_name.format(
+            module=getattr(func, "__module__", ""),
+            qualname=getattr(func, "__qualname__", func.__name__),
+            name=func.__name__,
+        )
+        return self.trace(operation_name, func)
+
+    def instrument_class(self, cls: type) -> type:
+        for name, attribute in list(vars(cls).items()):
+            qualname = f"{cls.__qualname__}.{name}"
+            if not self.selected(name, qualname):
+                continue
+            if isinstance(attribute, staticmethod):
+                setattr(cls, name, staticmethod(self.wrap(attribute.__func__)))
+            elif isinstance(attribute, classmethod):
+                setattr(cls, name, classmethod(self.wrap(attribute.__func__)))
+            elif isinstance(attribute, property):
+                setattr(
+                    cls,
+                    name,
+                    property(
+                        self.wrap(attribute.fget) if attribute.fget else None,
+                        self.wrap(attribute.fset) if attribute.fset else None,
+                        self.wrap(attribute.fdel) if attribute.fdel else None,
+                        attribute.__doc__,
+                    ),
+                )
+            elif inspect.isfunction(attribute):
+                setattr(cls, name, self.wrap(attribute))
+        return cls
+
+    def instrument_module(self, module: ModuleType) -> ModuleType:
+        for name, attribute in list(vars(module).items()):
+            if getattr(attribute, "__module__", None) != module.__name__:
+                continue
+            if inspect.isclass(attribute):
+                if not name.startswith("_"):
+                    self.instrument_class(attribute)
+            elif inspect.isfunction(attribute) and self.selected(name, attribute.__qualname__):
+                setattr(module, name, self.wrap(attribute))
+        return module
+
+    @staticmethod
+    def _matches(patterns: Sequence[str], name: str, qualname: str) -> bool:
+        return any(fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(qualname, pattern) for pattern in patterns)
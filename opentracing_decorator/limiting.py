@@ -0,0 +1,49 @@
+import threading
+import time
+from typing import Optional
+
+SUPPRESSED_TAG = "tracing.suppressed_calls"
+
+
+class RateLimiter:
+    """
+    A token bucket limiting how many spans are started per second.
+
+    Tokens refill at `rate` per second up to `burst`, which defaults to one
+    second's worth. Calls made while the bucket is empty are counted, and the
+    count is handed to the next call that gets a token so it can be reported
+    on that span.
+    """
+
+    __slots__ = ("rate", "burst", "total_suppressed", "_tokens", "_updated", "_suppressed", "_lock")
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self.total_suppressed = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[int]:
+        """
+        Take a token. Returns `None` when the call should not be traced,
+        otherwise the number of calls suppressed since the last token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if tokens < 1:
+                self._tokens = tokens
+                self._suppressed += 1
+                self.total_suppressed += 1
+                return None
+            self._tokens = tokens - 1
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
@@ -0,0 +1,180 @@
+import bisect
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+SUMMARY_TAG_PREFIX = "metrics."
+PERCENTILES = (("p50_ns", 0.5), ("p90_ns", 0.9), ("p99_ns", 0.99))
+
+# 1us up to about 16.8s, doubling.
+LATENCY_BUCKETS_NS = tuple(1_000 << shift for shift in range(25))
+
+
+class _Counters:
+    __slots__ = ("count", "errors", "total_ns", "buckets")
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.buckets = [0] * size
+
+
+class _ThreadMarker:
+    """
+    Kept in a thread's locals, so it's dropped when the thread exits.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire(aggregator: "weakref.ReferenceType[MetricsAggregator]", shard: Dict[str, _Counters]) -> None:
+    alive = aggregator()
+    if alive is not None:
+        alive._retire(shard)
+
+
+class MetricsAggregator:
+    """
+    Per-operation call counts, error counts and latency histograms.
+
+    Every thread records into its own shard, so recording takes no lock.
+    Snapshots add the shards up. When a thread exits, its shard is merged
+    into the totals of finished threads and dropped. Histogram buckets have fixed upper bounds,
+    the last bucket counts everything above the largest bound, and
+    percentiles are reported as the upper bound of the bucket they fall in.
+    """
+
+    def __init__(self, bucket_bounds_ns: Sequence[int] = LATENCY_BUCKETS_NS, interval: Optional[float] = None):
+        self.bucket_bounds_ns = tuple(sorted(bucket_bounds_ns))
+        self.interval_ns = int(interval * 1e9) if interval else None
+        self.next_emit_ns = time.perf_counter_ns() + self.interval_ns if self.interval_ns else None
+        self._local = threading.local()
+        self._shards: Dict[int, Dict[str, _Counters]] = {}
+        self._retired: Dict[str, _Counters] = {}
+        self._emitted: Dict[str, Tuple[int, int, int, List[int]]] = {}
+        self._lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+
+    def record(self, operation_name: str, elapsed_ns: int, error: bool = False) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._add_shard()
+        counters = shard.get(operation_name)
+        if counters is None:
+            counters = shard[operation_name] = _Counters(len(self.bucket_bounds_ns) + 1)
+        counters.count += 1
+        if error:
+            counters.errors += 1
+        counters.total_ns += elapsed_ns
+        counters.buckets[bisect.bisect_left(self.bucket_bounds_ns, elapsed_ns)] += 1
+
+    def _add_shard(self) -> Dict[str, _Counters]:
+        shard: Dict[str, _Counters] = {}
+        marker = _ThreadMarker()
+        finalizer = weakref.finalize(marker, _retire, weakref.ref(self), shard)
+        finalizer.atexit = False
+        with self._lock:
+            self._shards[id(shard)] = shard
+        self._local.shard = shard
+        self._local.marker = marker
+        return shard
+
+    def _retire(self, shard: Dict[str, _Counters]) -> None:
+        with self._lock:
+            del self._shards[id(shard)]
+            for name, counters in shard.items():
+                retired = self._retired.get(name)
+                if retired is None:
+                    self._retired[name] = counters
+                    continue
+                retired.count += counters.count
+                retired.errors += counters.errors
+                retired.total_ns += counters.total_ns
+                retired.buckets = [total + bucket for total, bucket in zip(retired.buckets, counters.buckets)]
+
+    def claim_emit(self, now_ns: int) -> bool:
+        """
+        Whether the caller should emit a summary now. Only one caller gets
+        `True` per interval.
+        """
+        if self.next_emit_ns is None or now_ns < self.next_emit_ns or not self._emit_lock.acquire(False):
+            return False
+        try:
+            if now_ns < self.next_emit_ns:
+                return False
+            assert self.interval_ns is not None
+            self.next_emit_ns = now_ns + self.interval_ns
+            return True
+        finally:
+            self._emit_lock.release()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: self._summary(*totals) for name, totals in self._totals().items()}
+
+    def delta(self) -> Dict[str, Dict[str, Any]]:
+        """
+        A snapshot of the calls recorded since the previous `delta()`.
+        """
+        summaries = {}
+        with self._emit_lock:
+            for name, (count, errors, total_ns, buckets) in self._totals().items():
+                previous = self._emitted.get(name)
+                self._emitted[name] = (count, errors, total_ns, buckets)
+                if previous is not None:
+                    count -= previous[0]
+                    errors -= previous[1]
+                    total_ns -= previous[2]
+                    buckets = [now - before for now, before in zip(buckets, previous[3])]
+                if count:
+                    summaries[name] = self._summary(count, errors, total_ns, buckets)
+        return summaries
+
+    def reset(self) -> None:
+        with self._lock:
+            for shard in self._shards.values():
+                shard.clear()
+            self._retired.clear()
+        with self._emit_lock:
+            self._emitted.clear()
+
+    def _totals(self) -> Dict[str, Tuple[int, int, int, List[int]]]:
+        totals: Dict[str, Tuple[int, int, int, List[int]]] = {}
+        with self._lock:
+            shards = [dict(self._retired), *self._shards.values()]
+        for shard in shards:
+            for name, counters in list(shard.items()):
+                count, errors, total_ns, buckets = totals.get(name, (0, 0, 0, [0] * len(counters.buckets)))
+                totals[name] = (
+                    count + counters.count,
+                    errors + counters.errors,
+                    total_ns + counters.total_ns,
+                    [total + bucket for total, bucket in zip(buckets, counters.buckets)],
+                )
+        return totals
+
+    def _summary(self, count: int, errors: int, total_ns: int, buckets: List[int]) -> Dict[str, Any]:
+        bounds: List[Any] = [*self.bucket_bounds_ns, "inf"]
+        summary: Dict[str, Any] = {
+            "count": count,
+            "errors": errors,
+            "total_ns": total_ns,
+            "mean_ns": total_ns / count if count else 0.0,
+        }
+        for name, quantile in PERCENTILES:
+            summary[name] = self._percentile(buckets, count, quantile)
+        summary["buckets"] = dict(zip(bounds, buckets))
+        return summary
+
+    def _percentile(self, buckets: List[int], count: int, quantile: float) -> Optional[int]:
+        if not count:
+            return None
+        rank = quantile * count
+        seen = 0
+        for bound, bucket in zip(self.bucket_bounds_ns, buckets):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return None
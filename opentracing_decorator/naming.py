@@ -0,0 +1,119 @@
+import string
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .binding import ParameterExtractor
+
+_MISSING = object()
+
+
+def parse_template(template: str) -> Optional[List[Tuple[str, Optional[str], Optional[str], str]]]:
+    """
+    Split a `str.format` style template into `(literal, field, conversion,
+    format_spec)` parts. Returns `None` when the string has no replacement
+    fields, or isn't a valid template, so it is used as a fixed name.
+    """
+    try:
+        parts = [
+            (literal, field, conversion, spec or "")
+            for literal, field, spec, conversion in string.Formatter().parse(template)
+        ]
+    except ValueError:
+        return None
+    if not any(field for _, field, _, _ in parts):
+        return None
+    return parts
+
+
+class OperationNamer:
+    """
+    Builds the operation name of each call from a template or a callable.
+
+    Templates reference parameters the same way `tag_parameters` does, such
+    as `"handle:{event.type}"`, and are compiled into an extractor that reads
+    only those values. Callables receive the call arguments. When a field
+    can't be resolved, the callable raises, or more than `max_names` distinct
+    names have been produced, the call uses `fallback` instead.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        operation_name: Union[str, Callable[..., str]],
+        max_names: int = 100,
+        fallback: Optional[str] = None,
+    ):
+        if max_names < 1:
+            raise ValueError("max_operation_names must be at least 1.")
+        self.max_names = max_names
+        self._callable: Optional[Callable[..., str]] = None
+        self._parts: List[Tuple[str, Optional[str], Optional[str], str]] = []
+        self._extract: Optional[ParameterExtractor] = None
+        if callable(operation_name):
+            self._callable = operation_name
+            default = getattr(func, "__qualname__", getattr(func, "__name__", "operation"))
+        else:
+            self._parts = parse_template(operation_name) or [(operation_name, None, None, "")]
+            self._extract = ParameterExtractor(func, [field for _, field, _, _ in self._parts if field])
+            default = operation_name
+        self.fallback: str = fallback or default
+        self.overflowed = 0
+        self._names: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def compile(
+        cls,
+        func: Callable,
+        operation_name: Union[str, Callable[..., str]],
+        max_names: int = 100,
+        fallback: Optional[str] = None,
+    ) -> Optional["OperationNamer"]:
+        """
+        Returns a namer, or `None` when `operation_name` is a fixed string.
+        """
+        if isinstance(operation_name, str) and parse_template(operation_name) is None:
+            return None
+        return cls(func, operation_name, max_names, fallback)
+
+    def __call__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        name = self._render(args, kwargs)
+        if name is None:
+            return self.fallback
+        if name in self._names:
+            return name
+        with self._lock:
+            if len(self._names) >= self.max_names:
+                self.overflowed += 1
+                return self.fallback
+            self._names.add(name)
+        return name
+
+    def _render(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+        if self._callable is not None:
+            try:
+                return str(self._callable(*args, **kwargs))
+            except Exception:
+                return None
+
+        assert self._extract is not None
+        values = self._extract(args, kwargs)
+        pieces = []
+        for literal, field, conversion, spec in self._parts:
+            pieces.append(literal)
+            if not field:
+                continue
+            value = values.get(field, _MISSING)
+            if value is _MISSING:
+                return None
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            elif conversion == "s":
+                value = str(value)
+            try:
+                pieces.append(format(value, spec))
+            except (TypeError, ValueError):
+                return None
+        return "".join(pieces)
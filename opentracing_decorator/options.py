@@ -0,0 +1,159 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from .limiting import RateLimiter
+
+if TYPE_CHECKING:
+    from .flattening import FlattenBudget
+
+# The reducer names `flattening.flatten` accepts, kept here so validating
+# options doesn't import it.
+REDUCER_NAMES = frozenset({"dot", "underscore", "tuple", "path"})
+
+Reducer = Union[str, Callable[[Any, Any], Any]]
+
+_FIELDS = (
+    "pass_span",
+    "tag_parameters",
+    "exclude_parameters",
+    "parameter_prefix",
+    "flatten_parameters",
+    "parameter_reducer",
+    "log_return",
+    "return_prefix",
+    "flatten_return",
+    "return_reducer",
+    "yield_batch_size",
+    "yield_sample_every",
+    "flatten_budget",
+    "rate_limit",
+    "max_operation_names",
+    "fallback_operation_name",
+    "capture_threshold",
+    "tags_at_start",
+)
+
+
+class TraceOptions:
+    """
+    How `Tracing.trace` records a decorated function.
+
+    Options are validated when the object is built and can't be changed
+    afterwards, so one instance can be shared by any number of decorators
+    or set as the default of a `Tracing`. `replace` returns a copy with some
+    options changed. `tag_parameters` given as a string or a sequence of
+    paths is stored as a tuple, `exclude_parameters` as a frozenset.
+    `exclude_parameters` leaves out whole parameters, dotted paths inside
+    them are refused.
+    """
+
+    __slots__ = _FIELDS + ("records_payload",)
+
+    pass_span: bool
+    tag_parameters: Union[bool, Tuple[str, ...]]
+    exclude_parameters: frozenset
+    parameter_prefix: Optional[str]
+    flatten_parameters: bool
+    parameter_reducer: Reducer
+    log_return: bool
+    return_prefix: str
+    flatten_return: bool
+    return_reducer: Reducer
+    yield_batch_size: int
+    yield_sample_every: int
+    flatten_budget: Optional["FlattenBudget"]
+    rate_limit: Union[float, RateLimiter, None]
+    max_operation_names: int
+    fallback_operation_name: Optional[str]
+    capture_threshold: Union[float, str, None]
+    tags_at_start: bool
+    records_payload: bool
+
+    def __init__(
+        self,
+        *,
+        pass_span: bool = False,
+        tag_parameters: Union[bool, str, Sequence[str]] = False,
+        exclude_parameters: Sequence[str] = (),
+        parameter_prefix: Optional[str] = None,
+        flatten_parameters: bool = True,
+        parameter_reducer: Reducer = "dot",
+        log_return: bool = False,
+        return_prefix: str = "return",
+        flatten_return: bool = True,
+        return_reducer: Reducer = "dot",
+        yield_batch_size: int = 100,
+        yield_sample_every: int = 1,
+        flatten_budget: Optional["FlattenBudget"] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        max_operation_names: int = 100,
+        fallback_operation_name: Optional[str] = None,
+        capture_threshold: Union[float, str, None] = None,
+        tags_at_start: bool = False,
+    ):
+        if yield_batch_size < 1 or yield_sample_every < 1:
+            raise ValueError("yield_batch_size and yield_sample_every must be at least 1.")
+        if max_operation_names < 1:
+            raise ValueError("max_operation_names must be at least 1.")
+        for reducer in (parameter_reducer, return_reducer):
+            if not callable(reducer) and reducer not in REDUCER_NAMES:
+                raise ValueError(f"unknown reducer {reducer!r}.")
+        for name in exclude_parameters:
+            if "." in name:
+                raise ValueError(f"exclude_parameters takes parameter names, not paths such as {name!r}.")
+
+        if isinstance(tag_parameters, str):
+            tag_parameters = (tag_parameters,)
+        elif tag_parameters is not True:
+            tag_parameters = tuple(tag_parameters) if tag_parameters else False
+
+        values = (
+            pass_span,
+            tag_parameters,
+            frozenset(exclude_parameters),
+            parameter_prefix,
+            flatten_parameters,
+            parameter_reducer,
+            log_return,
+            return_prefix,
+            flatten_return,
+            return_reducer,
+            yield_batch_size,
+            yield_sample_every,
+            flatten_budget,
+            rate_limit,
+            max_operation_names,
+            fallback_operation_name,
+            capture_threshold,
+            tags_at_start,
+        )
+        for name, value in zip(_FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "records_payload", bool(tag_parameters) or log_return)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("TraceOptions can't be changed, use replace() to make a modified copy.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("TraceOptions can't be changed, use replace() to make a modified copy.")
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _FIELDS}
+
+    def replace(self, **changes: Any) -> "TraceOptions":
+        if not changes:
+            return self
+        options = self._asdict()
+        options.update(changes)
+        return TraceOptions(**options)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TraceOptions):
+            return NotImplemented
+        return self._asdict() == other._asdict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in _FIELDS))
+
+    def __repr__(self) -> str:
+        options = ", ".join(f"{name}={value!r}" for name, value in self._asdict().items())
+        return f"TraceOptions({options})"
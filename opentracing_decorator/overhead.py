@@ -0,0 +1,75 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+OVERHEAD_TAG = "tracing.overhead_ns"
+
+PHASES = ("bind", "flatten", "convert", "set_tag", "log_kv")
+
+BUCKET_BOUNDS_NS = (1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000)
+
+
+class PhaseTimings(Dict[str, int]):
+    """
+    Nanoseconds spent in each tracing phase during a single call.
+    """
+
+    __slots__ = ()
+
+    def lap(self, phase: str, started: int) -> int:
+        now = time.perf_counter_ns()
+        self[phase] = self.get(phase, 0) + now - started
+        return now
+
+
+class _PhaseAggregate:
+    __slots__ = ("count", "total_ns", "buckets")
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.total_ns = 0
+        self.buckets = [0] * size
+
+
+class OverheadStats:
+    """
+    In-memory aggregates of the time spent in each tracing phase, per
+    operation name.
+
+    Every phase keeps a call count, a total and a histogram with fixed
+    bucket bounds. The last bucket counts everything above the largest bound.
+    """
+
+    def __init__(self, bucket_bounds_ns: Sequence[int] = BUCKET_BOUNDS_NS):
+        self.bucket_bounds_ns = tuple(sorted(bucket_bounds_ns))
+        self._aggregates: Dict[Tuple[str, str], _PhaseAggregate] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation_name: str, timings: Dict[str, int]) -> None:
+        bounds = self.bucket_bounds_ns
+        with self._lock:
+            for phase, elapsed in timings.items():
+                aggregate = self._aggregates.get((operation_name, phase))
+                if aggregate is None:
+                    aggregate = self._aggregates[(operation_name, phase)] = _PhaseAggregate(len(bounds) + 1)
+                aggregate.count += 1
+                aggregate.total_ns += elapsed
+                aggregate.buckets[bisect.bisect_left(bounds, elapsed)] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        bounds: List[Any] = [*self.bucket_bounds_ns, "inf"]
+        stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for (operation_name, phase), aggregate in self._aggregates.items():
+                stats.setdefault(operation_name, {})[phase] = {
+                    "count": aggregate.count,
+                    "total_ns": aggregate.total_ns,
+                    "mean_ns": aggregate.total_ns / aggregate.count,
+                    "buckets": dict(zip(bounds, aggregate.buckets)),
+                }
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._aggregates.clear()
@@ -0,0 +1,92 @@
+import functools
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict
+
+import opentracing
+from opentracing.propagation import Format
+
+
+def _name(fn: Callable) -> str:
+    return getattr(fn, "__qualname__", None) or type(fn).__qualname__
+
+
+def _run_in_span(
+    scope_manager: opentracing.ScopeManager, span: opentracing.Span, fn: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    with scope_manager.activate(span, False):
+        return fn(*args, **kwargs)
+
+
+def run_with_carrier(carrier: Dict[str, str], operation_name: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    Runs `fn` in a span continuing the trace injected into `carrier`.
+
+    Used in child processes, where the span is started with
+    `opentracing.global_tracer()`. Set it with a pool initializer. When the
+    carrier can't be extracted, `fn` runs without a span.
+    """
+    tracer = opentracing.global_tracer()
+    try:
+        context = tracer.extract(Format.TEXT_MAP, carrier)
+    except (opentracing.UnsupportedFormatException, opentracing.SpanContextCorruptedException):
+        context = None
+    if context is None:
+        return fn(*args, **kwargs)
+    with tracer.start_active_span(operation_name, child_of=context):
+        return fn(*args, **kwargs)
+
+
+class ContextPropagator:
+    """
+    Carries the active span of the submitting thread over to the code that
+    runs the work.
+
+    In-process, the span itself is reactivated around the work without
+    starting a new span. Across processes its context is injected into a
+    text map carrier, and the child continues the trace with a span named
+    after the function. When no span is active the work is passed through
+    untouched.
+    """
+
+    __slots__ = ("tracer",)
+
+    def __init__(self, tracer: opentracing.Tracer):
+        self.tracer = tracer
+
+    def wrap(self, fn: Callable) -> Callable:
+        scope_manager = self.tracer.scope_manager
+        scope = scope_manager.active
+        if scope is None:
+            return fn
+        return functools.partial(_run_in_span, scope_manager, scope.span, fn)
+
+    def wrap_for_process(self, fn: Callable) -> Callable:
+        scope = self.tracer.scope_manager.active
+        if scope is None or type(scope.span) is opentracing.Span:
+            return fn
+        carrier: Dict[str, str] = {}
+        try:
+            self.tracer.inject(scope.span.context, Format.TEXT_MAP, carrier)
+        except opentracing.UnsupportedFormatException:
+            return fn
+        return functools.partial(run_with_carrier, carrier, _name(fn), fn)
+
+
+class TracedExecutor(Executor):
+    """
+    Wraps a `concurrent.futures` executor so every submitted call runs under
+    the span that was active when it was submitted.
+    """
+
+    def __init__(self, executor: Executor, propagator: ContextPropagator):
+        self.executor = executor
+        self._wrap = propagator.wrap_for_process if isinstance(executor, ProcessPoolExecutor) else propagator.wrap
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:  # type: ignore[override]
+        return self.executor.submit(self._wrap(fn), *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, **kwargs: Any) -> None:  # type: ignore[override]
+        self.executor.shutdown(wait, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.executor, name)
@@ -0,0 +1,54 @@
+import contextvars
+from typing import Optional
+
+import opentracing
+
+
+class _ContextVarScope(opentracing.Scope):
+    def __init__(self, manager: "ContextVarScopeManager", span: opentracing.Span, finish_on_close: bool):
+        super().__init__(manager, span)
+        self._finish_on_close = finish_on_close
+        variable = manager._variable
+        self._previous = variable.get()
+        self._token = variable.set(self)
+
+    def close(self) -> None:
+        variable = self._manager._variable
+        if variable.get() is self:
+            try:
+                variable.reset(self._token)
+            except ValueError:
+                # Closed in another context than the one it was activated
+                # in, such as a callback running in a copied context.
+                variable.set(self._previous)
+        if self._finish_on_close:
+            self._span.finish()
+
+
+class ContextVarScopeManager(opentracing.ScopeManager):
+    """
+    A scope manager that keeps the active scope in a `contextvars.ContextVar`.
+
+    Every thread and every asyncio task sees its own active scope. Tasks
+    start with the scope that was active when they were created, so spans
+    started in them are children of the span that created the task. Worker
+    threads start with no active scope, `Tracing.traced_executor` carries it
+    over. Activating and closing a scope is a `ContextVar.set` and `reset`,
+    without locks.
+
+    A scope closed while it isn't the active one, because scopes were closed
+    out of order, still finishes its span but leaves the active scope alone.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._variable: contextvars.ContextVar[Optional[_ContextVarScope]] = contextvars.ContextVar(
+            "opentracing_decorator_scope", default=None
+        )
+
+    def activate(self, span: opentracing.Span, finish_on_close: bool) -> opentracing.Scope:
+        return _ContextVarScope(self, span, finish_on_close)
+
+    @property
+    def active(self) -> Optional[opentracing.Scope]:
+        return self._variable.get()
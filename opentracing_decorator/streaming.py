@@ -0,0 +1,170 @@
+import functools
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Optional, Tuple
+
+import opentracing
+
+ITEMS_TAG = "generator.items"
+TIME_TO_FIRST_ITEM_TAG = "generator.time_to_first_item"
+
+
+class ItemRecorder:
+    """
+    Tracks the items produced by a traced generator.
+
+    Counts items, measures the time until the first one and, when `log_items`
+    is given, hands every `sample_every`-th item to it in batches of
+    `batch_size`, keyed by item index.
+    """
+
+    __slots__ = ("_log_items", "_batch_size", "_sample_every", "_batch", "_started", "_first_item", "count")
+
+    def __init__(
+        self,
+        log_items: Optional[Callable[[Dict[int, Any]], None]] = None,
+        batch_size: int = 100,
+        sample_every: int = 1,
+    ):
+        self._log_items = log_items
+        self._batch_size = batch_size
+        self._sample_every = sample_every
+        self._batch: Dict[int, Any] = {}
+        self._started = time.perf_counter()
+        self._first_item: Optional[float] = None
+        self.count = 0
+
+    def observe(self, item: Any) -> None:
+        if self._first_item is None:
+            self._first_item = time.perf_counter() - self._started
+        if self._log_items is not None and self.count % self._sample_every == 0:
+            self._batch[self.count] = item
+            if len(self._batch) >= self._batch_size:
+                self.flush()
+        self.count += 1
+
+    def flush(self) -> None:
+        if self._batch:
+            batch, self._batch = self._batch, {}
+            assert self._log_items is not None
+            self._log_items(batch)
+
+    def finish(self, span: opentracing.Span) -> None:
+        self.flush()
+        span.set_tag(ITEMS_TAG, self.count)
+        if self._first_item is not None:
+            span.set_tag(TIME_TO_FIRST_ITEM_TAG, self._first_item)
+
+
+OnError = Callable[[opentracing.Span, BaseException], None]
+
+Start = Callable[
+    [Tuple[Any, ...], Dict[str, Any]],
+    Optional[Tuple[opentracing.Span, Any, ItemRecorder, opentracing.ScopeManager]],
+]
+
+
+def wrap_generator(func: Callable, start: Start, on_error: OnError) -> Callable:
+    """
+    Wrap a generator function so its span covers consuming the generator.
+
+    `start` opens the span, creates the generator and returns the scope
+    manager to activate the span in when iteration begins, or returns `None`
+    to run the generator untraced. `send()`, `throw()` and
+    `close()` are forwarded, and the span is active only while the generator
+    runs. It finishes once the generator is exhausted, closed or fails, and
+    `on_error` records anything raised.
+    """
+
+    @functools.wraps(func)
+    def generator_wrapper_trace(*args: Any, **kwargs: Any) -> Generator:
+        started = start(args, kwargs)
+        if started is None:
+            return (yield from func(*args, **kwargs))
+        span, generator, recorder, scope_manager = started
+        try:
+            method: Callable[[Any], Any] = generator.send
+            argument = None
+            while True:
+                scope = scope_manager.activate(span, False)
+                try:
+                    item = method(argument)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    scope.close()
+
+                recorder.observe(item)
+                try:
+                    argument = yield item
+                    method = generator.send
+                except GeneratorExit:
+                    generator.close()
+                    return None
+                except BaseException as error:
+                    method, argument = generator.throw, error
+        except BaseException as error:
+            on_error(span, error)
+            raise
+        finally:
+            recorder.finish(span)
+            span.finish()
+
+    return generator_wrapper_trace
+
+
+def wrap_async_generator(func: Callable, start: Start, on_error: OnError) -> Callable:
+    """
+    The async generator counterpart of `wrap_generator`.
+    """
+
+    @functools.wraps(func)
+    async def async_generator_wrapper_trace(*args: Any, **kwargs: Any) -> AsyncGenerator:
+        started = start(args, kwargs)
+        if started is None:
+            generator = func(*args, **kwargs)
+            method: Callable[[Any], Any] = generator.asend
+            argument = None
+            while True:
+                try:
+                    item = await method(argument)
+                except StopAsyncIteration:
+                    return
+                try:
+                    argument = yield item
+                    method = generator.asend
+                except GeneratorExit:
+                    await generator.aclose()
+                    return
+                except BaseException as error:
+                    method, argument = generator.athrow, error
+
+        span, generator, recorder, scope_manager = started
+        try:
+            method = generator.asend
+            argument = None
+            while True:
+                scope = scope_manager.activate(span, False)
+                try:
+                    item = await method(argument)
+                except StopAsyncIteration:
+                    return
+                finally:
+                    scope.close()
+
+                recorder.observe(item)
+                try:
+                    argument = yield item
+                    method = generator.asend
+                except GeneratorExit:
+                    await generator.aclose()
+                    return
+                except BaseException as error:
+                    method, argument = generator.athrow, error
+        except BaseException as error:
+            on_error(span, error)
+            raise
+        finally:
+            recorder.finish(span)
+            span.finish()
+
+    return async_generator_wrapper_trace
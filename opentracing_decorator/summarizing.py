@@ -0,0 +1,129 @@
+import itertools
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Summarizer = Callable[[Any, int], Any]
+
+_MAX_CACHED_TYPES = 1024
+
+
+def summarize_array(array: Any, max_items: int) -> Any:
+    return {
+        "type": type(array).__name__,
+        "shape": list(array.shape),
+        "dtype": str(array.dtype),
+        # Slicing the flat iterator copies only the head, where reshape(-1)
+        # copies a whole non-contiguous array.
+        "head": array.flat[:max_items].tolist(),
+    }
+
+
+def summarize_frame(frame: Any, max_items: int) -> Any:
+    columns = list(frame.columns[:max_items])
+    return {
+        "type": type(frame).__name__,
+        "shape": list(frame.shape),
+        "columns": columns,
+        "dtypes": [str(dtype) for dtype in frame.dtypes.iloc[:max_items]],
+        "head": frame.iloc[:max_items, :max_items].values.tolist(),
+    }
+
+
+def summarize_series(series: Any, max_items: int) -> Any:
+    return {
+        "type": type(series).__name__,
+        "shape": list(series.shape),
+        "dtype": str(series.dtype),
+        "head": series.iloc[:max_items].tolist(),
+    }
+
+
+def summarize_bytes(value: Any, max_items: int) -> Any:
+    if len(value) <= max_items:
+        return value
+    return {"type": type(value).__name__, "length": len(value), "head": value[:max_items].hex()}
+
+
+def summarize_memoryview(view: memoryview, max_items: int) -> Any:
+    summary = {"type": "memoryview", "nbytes": view.nbytes, "format": view.format, "shape": list(view.shape or ())}
+    if view.c_contiguous:
+        summary["head"] = view.cast("B")[:max_items].hex()
+    return summary
+
+
+def summarize_sequence(sequence: Any, max_items: int) -> Any:
+    if len(sequence) <= max_items:
+        return sequence
+    return {
+        "type": type(sequence).__name__,
+        "length": len(sequence),
+        "head": list(itertools.islice(sequence, max_items)),
+    }
+
+
+class SummarizerRegistry:
+    """
+    Replaces large values with small summaries before they are flattened and
+    converted into tags or logs.
+
+    Summarizers are looked up by the value's type, walking its MRO, and the
+    result is cached per type. Summarizers for optional libraries are
+    registered by module and attribute name, and only resolved when that
+    module is already in `sys.modules`, so nothing gets imported. A
+    summarizer gets the value and `max_items`, the number of elements to keep
+    as a sample, and returns the summary, or the value itself to leave it
+    alone.
+    """
+
+    def __init__(self, max_items: int = 10, builtins: bool = True):
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        self.max_items = max_items
+        self._summarizers: Dict[type, Summarizer] = {}
+        self._lazy: List[Tuple[str, str, Summarizer]] = []
+        self._cache: Dict[type, Optional[Summarizer]] = {}
+        self._lock = threading.Lock()
+        if builtins:
+            self.register(bytes, summarize_bytes)
+            self.register(bytearray, summarize_bytes)
+            self.register(memoryview, summarize_memoryview)
+            for kind in (list, tuple, set, frozenset):
+                self.register(kind, summarize_sequence)
+            self.register_lazy("numpy", "ndarray", summarize_array)
+            self.register_lazy("pandas", "DataFrame", summarize_frame)
+            self.register_lazy("pandas", "Series", summarize_series)
+
+    def register(self, kind: type, summarizer: Summarizer) -> None:
+        with self._lock:
+            self._summarizers[kind] = summarizer
+            self._cache.clear()
+
+    def register_lazy(self, module: str, attribute: str, summarizer: Summarizer) -> None:
+        with self._lock:
+            self._lazy.append((module, attribute, summarizer))
+            self._cache.clear()
+
+    def summarize(self, value: Any) -> Any:
+        kind = type(value)
+        try:
+            summarizer = self._cache[kind]
+        except KeyError:
+            summarizer = self._lookup(kind)
+            if len(self._cache) < _MAX_CACHED_TYPES:
+                self._cache[kind] = summarizer
+        if summarizer is None:
+            return value
+        return summarizer(value, self.max_items)
+
+    def _lookup(self, kind: type) -> Optional[Summarizer]:
+        for base in kind.__mro__:
+            summarizer = self._summarizers.get(base)
+            if summarizer is not None:
+                return summarizer
+        for module_name, attribute, summarizer in self._lazy:
+            module = sys.modules.get(module_name)
+            target = getattr(module, attribute, None) if module is not None else None
+            if isinstance(target, type) and issubclass(kind, target):
+                return summarizer
+        return None
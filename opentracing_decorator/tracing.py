@@ -1,24 +1,251 @@
 import functools
-import inspect
-import json
-from typing import Any, Callable, Dict, Optional
+import importlib
+import os
+import sys
+import time
+from types import CodeType, MethodType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import opentracing
-from flatten_dict import flatten
+from opentracing.ext import tags
+
+from .errors import StackFormatter, record_exception
+from .limiting import SUPPRESSED_TAG, RateLimiter
+from .metrics import SUMMARY_TAG_PREFIX, MetricsAggregator
+from .options import Reducer, TraceOptions
+from .overhead import OVERHEAD_TAG, OverheadStats, PhaseTimings
+from .streaming import ItemRecorder, wrap_async_generator, wrap_generator
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .background import BackgroundSerializer
+    from .caching import PayloadCache
+    from .flattening import FlattenBudget
+    from .propagation import TracedExecutor
+    from .summarizing import SummarizerRegistry
+
+NOOP_TRACER = opentracing.Tracer()
+
+ENABLED_VARIABLE = "OPENTRACING_DECORATOR_ENABLED"
+
+# Set on every wrapper `Tracing.trace` returns, so instrumenting a class or
+# module leaves functions that are already traced alone.
+TRACED_ATTRIBUTE = "_opentracing_decorator_traced"
+
+# The default of the `trace` keywords, telling options that weren't given
+# from ones explicitly set to their default value.
+_UNSET: Any = object()
+
+# A traced call in progress: its scope, operation name, whether its payload is
+# recorded, its overhead timings, when it started and the payloads queued for
+# the background serializer.
+_Call = Tuple[opentracing.Scope, str, bool, Optional[PhaseTimings], float, Optional[List[Callable]]]
+
+
+def enabled_by_default() -> bool:
+    return os.environ.get(ENABLED_VARIABLE, "").strip().lower() not in ("0", "false", "no", "off")
+
+
+@functools.lru_cache(maxsize=None)
+def _import(module: str) -> ModuleType:
+    """
+    Import a submodule the first time a call needs it. Cached, since a
+    function-level import statement costs about a microsecond every call.
+    """
+    return importlib.import_module(module, __package__)
+
+
+# The code flags `inspect` tests for, so decorating a function doesn't have to
+# import it.
+_CO_GENERATOR = 0x20
+_CO_COROUTINE = 0x80
+_CO_ASYNC_GENERATOR = 0x200
+
+
+def _has_code_flag(func: Callable, flag: int) -> bool:
+    while True:
+        if isinstance(func, functools.partial):
+            func = func.func
+        elif isinstance(func, MethodType):
+            func = func.__func__
+        else:
+            break
+    code = getattr(func, "__code__", None)
+    return isinstance(code, CodeType) and bool(code.co_flags & flag)
+
+
+def _is_generator_function(func: Callable) -> bool:
+    return _has_code_flag(func, _CO_GENERATOR | _CO_ASYNC_GENERATOR)
+
+
+def _is_coroutine_function(func: Callable) -> bool:
+    if _has_code_flag(func, _CO_COROUTINE):
+        return True
+    # Functions marked with `inspect.markcoroutinefunction` have no code flag,
+    # and marking them imports `inspect`. Before Python 3.8 `inspect` doesn't
+    # unwrap partials, so it only adds to the code flags.
+    inspect = sys.modules.get("inspect")
+    return inspect is not None and inspect.iscoroutinefunction(func)
+
+
+def span_is_recording(span: opentracing.Span) -> bool:
+    if type(span) is opentracing.Span:
+        return False
+    is_sampled = getattr(span, "is_sampled", None)
+    if is_sampled is not None:
+        return bool(is_sampled())
+    return bool(getattr(span.context, "sampled", True))
 
 
 class Tracing:
     def __init__(
         self,
         tracer: opentracing.Tracer = None,
+        is_recording: Optional[Callable[[opentracing.Span], bool]] = None,
+        serializer: Optional["BackgroundSerializer"] = None,
+        flatten_budget: Optional["FlattenBudget"] = None,
+        measure_overhead: bool = False,
+        tag_overhead: bool = False,
+        rate_limit: Optional[float] = None,
+        enabled: Optional[bool] = None,
+        remove_when_disabled: bool = False,
+        summarizers: Optional["SummarizerRegistry"] = None,
+        record_exceptions: bool = True,
+        max_stack_frames: int = 20,
+        payload_cache: Optional["PayloadCache"] = None,
+        metrics_interval: Optional[float] = None,
+        options: Optional[TraceOptions] = None,
+        scope_manager: Optional[opentracing.ScopeManager] = None,
     ):
         if not tracer:
             self.tracer = opentracing.tracer
         else:
             self.tracer = tracer
+        self._global_tracer = not tracer
+        if scope_manager is not None:
+            self.use_scope_manager(scope_manager)
+        self.is_recording = is_recording or span_is_recording
+        self.serializer = serializer
+        self.flatten_budget = flatten_budget
+        self.overhead = OverheadStats() if measure_overhead or tag_overhead else None
+        self.tag_overhead = tag_overhead
+        self.rate_limit = rate_limit
+        self._rate_limiters: Dict[Tuple[str, float], RateLimiter] = {}
+        self.enabled = enabled_by_default() if enabled is None else enabled
+        self.remove_when_disabled = remove_when_disabled
+        self.summarizers = summarizers
+        self.stacks = StackFormatter(max_stack_frames) if record_exceptions else None
+        self.payload_cache = payload_cache
+        self.metrics = MetricsAggregator(interval=metrics_interval)
+        self._metrics_since = time.time()
+        self.options = TraceOptions() if options is None else options
+
+    def use_scope_manager(self, scope_manager: opentracing.ScopeManager) -> None:
+        """
+        Make the tracer keep active spans in `scope_manager`, such as a
+        `ContextVarScopeManager`. Do this before any span is active.
+
+        Raises `ValueError` for the global tracer, which other code shares,
+        and `TypeError` for tracers that don't keep their scope manager where
+        `opentracing.Tracer` does. Create those with the scope manager.
+        """
+        if self._global_tracer:
+            raise ValueError("the global tracer is shared, pass a tracer to Tracing to change its scope manager.")
+        # Tracers take their scope manager when they're created, the
+        # OpenTracing base class keeps it here.
+        tracer = self.tracer
+        previous = getattr(tracer, "_scope_manager", None)
+        tracer._scope_manager = scope_manager
+        if tracer.scope_manager is not scope_manager:
+            tracer._scope_manager = previous
+            raise TypeError(f"{type(tracer).__name__} doesn't take a scope manager after it's created.")
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Stop tracing. Decorated functions call straight through to the wrapped
+        function until `enable()` is called.
+        """
+        self.enabled = False
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self.overhead is None:
+            return {}
+        return self.overhead.snapshot()
+
+    def wrap_context(self, fn: Callable) -> Callable:
+        """
+        Bind `fn` to the currently active span, so it runs under that span
+        when called later from another thread.
+        """
+        from .propagation import ContextPropagator
+
+        return ContextPropagator(self.tracer).wrap(fn)
+
+    def traced_executor(self, executor: "Executor") -> "TracedExecutor":
+        """
+        Wrap a thread or process pool executor so submitted work continues
+        the trace that was active at submission.
+        """
+        from .propagation import ContextPropagator, TracedExecutor
+
+        return TracedExecutor(executor, ContextPropagator(self.tracer))
+
+    def emit_metrics(self) -> None:
+        """
+        Report what `measure` recorded since the last emit, as one Span per
+        operation covering that period.
+        """
+        now = time.time()
+        since, self._metrics_since = self._metrics_since, now
+        for operation_name, summary in self.metrics.delta().items():
+            tags = {
+                SUMMARY_TAG_PREFIX + key: value
+                for key, value in summary.items()
+                if key != "buckets" and value is not None
+            }
+            # Emitted from whichever call crosses the interval, but summarizing
+            # the whole process, so never a child of that call's span.
+            span = self.tracer.start_span(operation_name, tags=tags, start_time=since, ignore_active_span=True)
+            span.finish(finish_time=now)
+
+    def _record_overhead(self, operation_name: str, span: opentracing.Span, timings: PhaseTimings) -> None:
+        assert self.overhead is not None
+        self.overhead.record(operation_name, timings)
+        if self.tag_overhead:
+            span.set_tag(OVERHEAD_TAG, sum(timings.values()))
+
+    def _record_exception(self, span: opentracing.Span, error: BaseException) -> None:
+        if self.stacks is None:
+            span._on_error(span, type(error), error, error.__traceback__)
+        elif self.is_recording(span):
+            record_exception(span, error, self.stacks)
+        else:
+            span.set_tag(tags.ERROR, True)
+
+    def _rate_limiter(self, operation_name: str, rate_limit: Union[float, RateLimiter, None]) -> Optional[RateLimiter]:
+        if isinstance(rate_limit, RateLimiter):
+            return rate_limit
+        rate = rate_limit if rate_limit is not None else self.rate_limit
+        if rate is None:
+            return None
+        return self._rate_limiters.setdefault((operation_name, rate), RateLimiter(rate))
 
     def _safe_convert(self, dikt: Dict[Any, Any]) -> Dict[Any, Any]:
-        return json.loads(json.dumps(dikt, default=str))
+        return _import(".conversion").safe_convert(dikt)
 
     def _dict_to_tag(self, span: opentracing.Span, dikt: Dict[Any, Any]) -> None:
         if not isinstance(dikt, dict):
@@ -28,12 +255,29 @@ class Tracing:
                 span.set_tag(key, value)
 
     def _map_parameters(self, func: Callable, *args: Any, **kwargs: Any) -> Dict[Any, Any]:
-        bound_arguments = inspect.signature(func).bind(*args, **kwargs)
-        bound_arguments.apply_defaults()
-        return {key: value for key, value in bound_arguments.arguments.items() if key != "self"}
+        from .binding import ParameterBinder
+
+        return ParameterBinder(func)(args, kwargs)
+
+    def _summarize(self, dikt: Dict[Any, Any]) -> Dict[Any, Any]:
+        assert self.summarizers is not None
+        summarize = self.summarizers.summarize
+        return {key: summarize(value) for key, value in dikt.items()}
 
-    def _flatten_dict(self, dikt: Dict[Any, Any], reducer: str = "dot") -> Dict[Any, Any]:
-        return flatten(dikt, reducer=reducer, enumerate_types=(list,))
+    def _flatten_dict(
+        self,
+        dikt: Dict[Any, Any],
+        reducer: Reducer = "dot",
+        budget: Optional["FlattenBudget"] = None,
+    ) -> Dict[Any, Any]:
+        flattening = _import(".flattening")
+        if budget is None:
+            budget = self.flatten_budget
+        summarize = self.summarizers.summarize if self.summarizers is not None else None
+        flat, truncated = flattening.flatten(dikt, reducer, budget, summarize)
+        if truncated:
+            flat[flattening.TRUNCATED_KEY] = True
+        return flat
 
     def _tag_parameters(
         self,
@@ -42,16 +286,70 @@ class Tracing:
         *args: Any,
         parameter_prefix: str = None,
         flatten_parameters: bool = True,
-        parameter_reducer: str = "dot",
+        parameter_reducer: Reducer = "dot",
         **kwargs: Any,
     ) -> None:
-        mapped_parameters = self._map_parameters(func, *args, **kwargs)
-        if parameter_prefix:
-            mapped_parameters = {parameter_prefix: mapped_parameters}
-        if flatten_parameters:
-            mapped_parameters = self._flatten_dict(mapped_parameters, reducer=parameter_reducer)
-        mapped_parameters = self._safe_convert(mapped_parameters)
+        self._tag_mapped_parameters(
+            span,
+            self._map_parameters(func, *args, **kwargs),
+            parameter_prefix=parameter_prefix,
+            flatten_parameters=flatten_parameters,
+            parameter_reducer=parameter_reducer,
+        )
+
+    def _serialize(
+        self,
+        payload: Dict[Any, Any],
+        prefix: Optional[str],
+        flatten_payload: bool,
+        reducer: Reducer,
+        budget: Optional["FlattenBudget"],
+        timings: Optional[PhaseTimings],
+    ) -> Dict[Any, Any]:
+        cache = self.payload_cache
+        key = None
+        if cache is not None:
+            key = cache.key((prefix, flatten_payload, reducer, budget), payload)
+            if key is not None:
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+
+        started = time.perf_counter_ns() if timings is not None else 0
+        if prefix:
+            payload = {prefix: payload}
+        if flatten_payload:
+            payload = self._flatten_dict(payload, reducer=reducer, budget=budget)
+            if timings is not None:
+                started = timings.lap("flatten", started)
+        elif self.summarizers is not None:
+            payload = self._summarize(payload)
+        payload = self._safe_convert(payload)
+        if timings is not None:
+            timings.lap("convert", started)
+
+        if key is not None:
+            assert cache is not None
+            cache.put(key, payload)
+        return payload
+
+    def _tag_mapped_parameters(
+        self,
+        span: opentracing.Span,
+        mapped_parameters: Dict[Any, Any],
+        parameter_prefix: Optional[str] = None,
+        flatten_parameters: bool = True,
+        parameter_reducer: Reducer = "dot",
+        flatten_budget: Optional["FlattenBudget"] = None,
+        timings: Optional[PhaseTimings] = None,
+    ) -> None:
+        mapped_parameters = self._serialize(
+            mapped_parameters, parameter_prefix, flatten_parameters, parameter_reducer, flatten_budget, timings
+        )
+        started = time.perf_counter_ns() if timings is not None else 0
         self._dict_to_tag(span, mapped_parameters)
+        if timings is not None:
+            timings.lap("set_tag", started)
 
     def _log_return(
         self,
@@ -59,76 +357,499 @@ class Tracing:
         value: Any,
         return_prefix: str = "return",
         flatten_return: bool = True,
-        return_reducer: str = "dot",
+        return_reducer: Reducer = "dot",
+        flatten_budget: Optional["FlattenBudget"] = None,
+        timings: Optional[PhaseTimings] = None,
     ) -> None:
-        return_log = {return_prefix: value}
-        if flatten_return:
-            return_log = self._flatten_dict(return_log, reducer=return_reducer)
-        return_log = self._safe_convert(return_log)
-        span.log_kv(return_log)
+        return_log = self._serialize(
+            {return_prefix: value}, None, flatten_return, return_reducer, flatten_budget, timings
+        )
+        started = time.perf_counter_ns() if timings is not None else 0
+        span.log_kv(dict(return_log) if self.payload_cache is not None else return_log)
+        if timings is not None:
+            timings.lap("log_kv", started)
 
     def trace(
         self,
-        operation_name: str,
+        operation_name: Union[str, Callable[..., str]],
         func: Optional[Callable] = None,
         *,
-        pass_span: bool = False,
-        tag_parameters: bool = False,
-        parameter_prefix: str = None,
-        flatten_parameters: bool = True,
-        parameter_reducer: str = "dot",
-        log_return: bool = False,
-        return_prefix: str = "return",
-        flatten_return: bool = True,
-        return_reducer: str = "dot",
+        options: Optional[TraceOptions] = None,
+        pass_span: bool = _UNSET,
+        tag_parameters: Union[bool, str, Sequence[str]] = _UNSET,
+        exclude_parameters: Sequence[str] = _UNSET,
+        parameter_prefix: Optional[str] = _UNSET,
+        flatten_parameters: bool = _UNSET,
+        parameter_reducer: Reducer = _UNSET,
+        log_return: bool = _UNSET,
+        return_prefix: str = _UNSET,
+        flatten_return: bool = _UNSET,
+        return_reducer: Reducer = _UNSET,
+        yield_batch_size: int = _UNSET,
+        yield_sample_every: int = _UNSET,
+        flatten_budget: Optional["FlattenBudget"] = _UNSET,
+        rate_limit: Union[float, RateLimiter, None] = _UNSET,
+        max_operation_names: int = _UNSET,
+        fallback_operation_name: Optional[str] = _UNSET,
+        capture_threshold: Union[float, str, None] = _UNSET,
+        tags_at_start: bool = _UNSET,
     ) -> Callable:
+        """
+        Trace `func`, using `options`, or the options this `Tracing` was
+        created with, changed by the `TraceOptions` keywords that are given.
+        """
+        overrides = {
+            "pass_span": pass_span,
+            "tag_parameters": tag_parameters,
+            "exclude_parameters": exclude_parameters,
+            "parameter_prefix": parameter_prefix,
+            "flatten_parameters": flatten_parameters,
+            "parameter_reducer": parameter_reducer,
+            "log_return": log_return,
+            "return_prefix": return_prefix,
+            "flatten_return": flatten_return,
+            "return_reducer": return_reducer,
+            "yield_batch_size": yield_batch_size,
+            "yield_sample_every": yield_sample_every,
+            "flatten_budget": flatten_budget,
+            "rate_limit": rate_limit,
+            "max_operation_names": max_operation_names,
+            "fallback_operation_name": fallback_operation_name,
+            "capture_threshold": capture_threshold,
+            "tags_at_start": tags_at_start,
+        }
+        options = (self.options if options is None else options).replace(
+            **{name: value for name, value in overrides.items() if value is not _UNSET}
+        )
         if func is None:
-            func = functools.partial(
-                self.trace,
-                operation_name,
-                pass_span=pass_span,
-                tag_parameters=tag_parameters,
-                parameter_prefix=parameter_prefix,
-                flatten_parameters=flatten_parameters,
-                parameter_reducer=parameter_reducer,
-                log_return=log_return,
-                return_prefix=return_prefix,
-                flatten_return=flatten_return,
-                return_reducer=return_reducer,
+            return functools.partial(self.trace, operation_name, options=options)
+
+        traced = self._wrap(operation_name, func, options)
+        if traced is not func:
+            setattr(traced, TRACED_ATTRIBUTE, True)
+        return traced
+
+    def _wrap(self, operation_name: Union[str, Callable[..., str]], func: Callable, options: TraceOptions) -> Callable:
+        pass_span = options.pass_span
+        log_return = options.log_return
+        if self.remove_when_disabled and not self.enabled and not pass_span:
+            return func
+
+        # The passed span isn't a parameter of the call, and is only set once
+        # the span starts, after the tags at start are bound.
+        excluded = options.exclude_parameters | {"span"} if pass_span else options.exclude_parameters
+        binder: Optional[Callable[[Tuple[Any, ...], Dict[str, Any]], Dict[str, Any]]] = None
+        if options.tag_parameters is True:
+            from .binding import IGNORED_PARAMETERS, ParameterBinder
+
+            binder = ParameterBinder(func, IGNORED_PARAMETERS | excluded)
+        elif options.tag_parameters:
+            from .binding import ParameterExtractor, outermost_paths
+
+            binder = ParameterExtractor(func, outermost_paths(options.tag_parameters), excluded)
+        namer = None
+        if callable(operation_name) or "{" in operation_name:
+            from .naming import OperationNamer
+
+            namer = OperationNamer.compile(
+                func, operation_name, options.max_operation_names, options.fallback_operation_name
             )
+        static_name = namer.fallback if namer is not None else operation_name
+        assert isinstance(static_name, str)
+        limiter = self._rate_limiter(static_name, options.rate_limit)
 
-        @functools.wraps(func)
-        def wrapper_trace(*args: Any, **kwargs: Any) -> Any:
-            with self.tracer.start_active_span(operation_name) as scope:
-                span = scope.span
+        def tag(span: opentracing.Span, mapped_parameters: Dict[str, Any], timings: Optional[PhaseTimings]) -> None:
+            self._tag_mapped_parameters(
+                span,
+                mapped_parameters,
+                options.parameter_prefix,
+                options.flatten_parameters,
+                options.parameter_reducer,
+                options.flatten_budget,
+                timings,
+            )
+
+        def log(span: opentracing.Span, value: Any, timings: Optional[PhaseTimings] = None) -> None:
+            self._log_return(
+                span,
+                value,
+                options.return_prefix,
+                options.flatten_return,
+                options.return_reducer,
+                options.flatten_budget,
+                timings,
+            )
+
+        tail = None
+        if options.capture_threshold is not None:
+            from .capture import CAPTURE_TAG, ERROR, SLOW, TailCapture
+
+            tail = TailCapture(options.capture_threshold)
+
+        def capture(
+            span: opentracing.Span,
+            reason: str,
+            mapped_parameters: Optional[Dict[str, Any]],
+            value: Any,
+            timings: Optional[PhaseTimings],
+        ) -> None:
+            span.set_tag(CAPTURE_TAG, reason)
+            if mapped_parameters is not None:
+                tag(span, mapped_parameters, timings)
+            if log_return and reason == SLOW:
+                log(span, value, timings)
+
+        def bind(args: Tuple[Any, ...], kwargs: Dict[str, Any], timings: Optional[PhaseTimings]) -> Dict[str, Any]:
+            assert binder is not None
+            if timings is None:
+                return binder(args, kwargs)
+            started = time.perf_counter_ns()
+            mapped_parameters = binder(args, kwargs)
+            timings.lap("bind", started)
+            return mapped_parameters
+
+        tag_at_start = binder is not None and tail is None
+
+        def start_scope(
+            tracer: opentracing.Tracer, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+        ) -> Tuple[opentracing.Scope, Optional[PhaseTimings], bool]:
+            """
+            Start the active span, passing it the parameter tags when the span
+            is expected to be recorded: its parent is, or `tags_at_start` is
+            set. The start time is taken before the tags are computed.
+            """
+            if not options.tags_at_start:
+                parent = tracer.active_span
+                if parent is None or not self.is_recording(parent):
+                    return tracer.start_active_span(name), None, False
+
+            start_time = time.time()
+            timings = PhaseTimings() if self.overhead is not None else None
+            try:
+                tags = self._serialize(
+                    bind(args, kwargs, timings),
+                    options.parameter_prefix,
+                    options.flatten_parameters,
+                    options.parameter_reducer,
+                    options.flatten_budget,
+                    timings,
+                )
+            except BaseException as error:
+                scope = tracer.start_active_span(name, start_time=start_time)
+                self._record_exception(scope.span, error)
+                scope.close()
+                raise
+            if self.payload_cache is not None:
+                tags = dict(tags)
+            return tracer.start_active_span(name, tags=tags, start_time=start_time), timings, True
+
+        if _is_generator_function(func):
+
+            def start(
+                args: Tuple[Any, ...], kwargs: Dict[str, Any]
+            ) -> Optional[Tuple[opentracing.Span, Any, ItemRecorder, opentracing.ScopeManager]]:
+                if not self.enabled:
+                    if pass_span:
+                        kwargs["span"] = NOOP_TRACER.start_span(static_name)
+                    return None
+
+                tracer = self.tracer
+                name = static_name if namer is None else namer(args, kwargs)
+                span = tracer.start_span(name)
+                recording = options.records_payload and self.is_recording(span)
+                try:
+                    if pass_span:
+                        kwargs["span"] = span
+
+                    if binder is not None and recording:
+                        tag(span, bind(args, kwargs, None), None)
+
+                    generator = func(*args, **kwargs)
+                except BaseException as error:
+                    self._record_exception(span, error)
+                    span.finish()
+                    raise
+
+                log_items = functools.partial(log, span) if log_return and recording else None
+                recorder = ItemRecorder(log_items, options.yield_batch_size, options.yield_sample_every)
+                return span, generator, recorder, tracer.scope_manager
+
+            if _has_code_flag(func, _CO_ASYNC_GENERATOR):
+                return wrap_async_generator(func, start, self._record_exception)
+            return wrap_generator(func, start, self._record_exception)
+
+        if binder is None and not log_return and tail is None and not pass_span and namer is None and limiter is None:
+            return self._plain_wrapper(func, static_name)
+
+        serializer = self.serializer
+        if serializer is not None:
+            from .background import snapshot
+
+        def enter(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Tuple[opentracing.Tracer, str, int]]:
+            """
+            Return the tracer, operation name and suppressed count of a call
+            that is traced, or pass a no-op span if asked to and return None.
+            """
+            if self.enabled:
+                tracer = self.tracer
+                suppressed: Optional[int] = 0
+                if type(tracer) is opentracing.Tracer:
+                    suppressed = None
+                elif limiter is not None:
+                    suppressed = limiter.acquire()
+                if suppressed is not None:
+                    return tracer, static_name if namer is None else namer(args, kwargs), suppressed
+            if pass_span:
+                kwargs["span"] = NOOP_TRACER.start_span(static_name)
+            return None
+
+        def emit(
+            payloads: Optional[List[Callable]],
+            step: Callable,
+            span: opentracing.Span,
+            *payload: Any,
+            timings: Optional[PhaseTimings],
+        ) -> None:
+            """
+            Run a tag, capture or log step now, or queue it for the serializer
+            with a snapshot of its payload.
+            """
+            if payloads is None:
+                step(span, *payload, timings)
+            else:
+                payloads.append(functools.partial(step, span, *map(snapshot, payload), timings))
+
+        def parameters(args: Tuple[Any, ...], kwargs: Dict[str, Any], timings: Optional[PhaseTimings]) -> Any:
+            return bind(args, kwargs, timings) if binder is not None else None
+
+        def begin(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[_Call]:
+            """
+            Start the span of a call and tag its parameters, or return None
+            when the call isn't traced.
+            """
+            entered = enter(args, kwargs)
+            if entered is None:
+                return None
+            tracer, name, suppressed = entered
+
+            payloads: Optional[List[Callable]] = None
+            if serializer is not None:
+                scope, timings, tagged = tracer.start_active_span(name, finish_on_close=False), None, False
+                payloads = []
+            elif tag_at_start:
+                scope, timings, tagged = start_scope(tracer, name, args, kwargs)
+            else:
+                scope, timings, tagged = tracer.start_active_span(name), None, False
+            span = scope.span
+            try:
+                if suppressed:
+                    span.set_tag(SUPPRESSED_TAG, suppressed)
+                recording = options.records_payload and self.is_recording(span)
+                if timings is None and recording and self.overhead is not None:
+                    timings = PhaseTimings()
 
                 if pass_span:
                     kwargs["span"] = span
 
-                assert func is not None
+                if binder is not None and recording and tail is None and not tagged:
+                    emit(payloads, tag, span, bind(args, kwargs, timings), timings=timings)
+            except BaseException as error:
+                self._record_exception(span, error)
+                close(scope, name, timings, payloads)
+                raise
+            started = time.perf_counter() if tail is not None else 0.0
+            return scope, name, recording, timings, started, payloads
 
-                if tag_parameters:
-                    self._tag_parameters(
-                        span,
-                        func,
-                        *args,
-                        parameter_prefix=parameter_prefix,
-                        flatten_parameters=flatten_parameters,
-                        parameter_reducer=parameter_reducer,
-                        **kwargs,
-                    )
+        def close(
+            scope: opentracing.Scope, name: str, timings: Optional[PhaseTimings], payloads: Optional[List[Callable]]
+        ) -> None:
+            scope.close()
+            if payloads is not None:
+                assert serializer is not None
+                if timings is not None:
+                    payloads.append(functools.partial(self._record_overhead, name, scope.span, timings))
+                serializer.submit(scope.span, payloads, time.time())
 
-                value = func(*args, **kwargs)
+        def fail(call: _Call, args: Tuple[Any, ...], kwargs: Dict[str, Any], error: BaseException) -> None:
+            scope, name, recording, timings, _, payloads = call
+            try:
+                if tail is not None and recording:
+                    emit(payloads, capture, scope.span, ERROR, parameters(args, kwargs, timings), None, timings=timings)
+            finally:
+                self._record_exception(scope.span, error)
+                close(scope, name, timings, payloads)
 
-                if log_return:
-                    self._log_return(
-                        span,
-                        value,
-                        return_prefix=return_prefix,
-                        flatten_return=flatten_return,
-                        return_reducer=return_reducer,
-                    )
+        def finish(call: _Call, args: Tuple[Any, ...], kwargs: Dict[str, Any], value: Any) -> None:
+            scope, name, recording, timings, started, payloads = call
+            span = scope.span
+            try:
+                if recording:
+                    if tail is not None:
+                        if tail.is_slow(time.perf_counter() - started):
+                            emit(
+                                payloads, capture, span, SLOW, parameters(args, kwargs, timings), value, timings=timings
+                            )
+                    elif log_return:
+                        emit(payloads, log, span, value, timings=timings)
+                if timings is not None and payloads is None:
+                    self._record_overhead(name, span, timings)
+            except BaseException as error:
+                self._record_exception(span, error)
+                raise
+            finally:
+                close(scope, name, timings, payloads)
 
+        if _is_coroutine_function(func):
+
+            @functools.wraps(func)
+            async def async_wrapper_trace(*args: Any, **kwargs: Any) -> Any:
+                call = begin(args, kwargs)
+                if call is None:
+                    return await func(*args, **kwargs)
+                try:
+                    value = await func(*args, **kwargs)
+                except BaseException as error:
+                    fail(call, args, kwargs, error)
+                    raise
+                finish(call, args, kwargs, value)
                 return value
 
+            return async_wrapper_trace
+
+        @functools.wraps(func)
+        def wrapper_trace(*args: Any, **kwargs: Any) -> Any:
+            call = begin(args, kwargs)
+            if call is None:
+                return func(*args, **kwargs)
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as error:
+                fail(call, args, kwargs, error)
+                raise
+            finish(call, args, kwargs, value)
+            return value
+
         return wrapper_trace
+
+    def _plain_wrapper(self, func: Callable, operation_name: str) -> Callable:
+        """
+        The wrapper for functions that only need a Span: nothing is tagged,
+        logged or captured, and the name and rate are fixed.
+        """
+        if _is_coroutine_function(func):
+
+            @functools.wraps(func)
+            async def async_wrapper_trace(*args: Any, **kwargs: Any) -> Any:
+                tracer = self.tracer
+                if not self.enabled or type(tracer) is opentracing.Tracer:
+                    return await func(*args, **kwargs)
+
+                scope = tracer.start_active_span(operation_name)
+                try:
+                    return await func(*args, **kwargs)
+                except BaseException as error:
+                    self._record_exception(scope.span, error)
+                    raise
+                finally:
+                    scope.close()
+
+            return async_wrapper_trace
+
+        @functools.wraps(func)
+        def wrapper_trace(*args: Any, **kwargs: Any) -> Any:
+            tracer = self.tracer
+            if not self.enabled or type(tracer) is opentracing.Tracer:
+                return func(*args, **kwargs)
+
+            scope = tracer.start_active_span(operation_name)
+            try:
+                return func(*args, **kwargs)
+            except BaseException as error:
+                self._record_exception(scope.span, error)
+                raise
+            finally:
+                scope.close()
+
+        return wrapper_trace
+
+    def measure(self, operation_name: str, func: Optional[Callable] = None) -> Callable:
+        """
+        Count calls, errors and latency of `func` per operation name, without
+        starting a Span for each call.
+        """
+        if func is None:
+            return functools.partial(self.measure, operation_name)
+        if _is_generator_function(func):
+            raise ValueError("measure doesn't support generator functions.")
+
+        metrics = self.metrics
+
+        if _is_coroutine_function(func):
+
+            @functools.wraps(func)
+            async def async_wrapper_measure(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+
+                started = time.perf_counter_ns()
+                try:
+                    value = await func(*args, **kwargs)
+                except BaseException:
+                    metrics.record(operation_name, time.perf_counter_ns() - started, True)
+                    raise
+                now = time.perf_counter_ns()
+                metrics.record(operation_name, now - started)
+                if metrics.claim_emit(now):
+                    self.emit_metrics()
+                return value
+
+            return async_wrapper_measure
+
+        @functools.wraps(func)
+        def wrapper_measure(*args: Any, **kwargs: Any) -> Any:
+            if not self.enabled:
+                return func(*args, **kwargs)
+
+            started = time.perf_counter_ns()
+            try:
+                value = func(*args, **kwargs)
+            except BaseException:
+                metrics.record(operation_name, time.perf_counter_ns() - started, True)
+                raise
+            now = time.perf_counter_ns()
+            metrics.record(operation_name, now - started)
+            if metrics.claim_emit(now):
+                self.emit_metrics()
+            return value
+
+        return wrapper_measure
+
+    def trace_class(
+        self,
+        cls: Optional[type] = None,
+        *,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        operation_name: str = "{qualname}",
+        **options: Any,
+    ) -> Any:
+        from .instrumentation import Instrumentation
+
+        instrumentation = Instrumentation(functools.partial(self.trace, **options), include, exclude, operation_name)
+        if cls is None:
+            return instrumentation.instrument_class
+        return instrumentation.instrument_class(cls)
+
+    def trace_module(
+        self,
+        module: ModuleType,
+        *,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        operation_name: str = "{qualname}",
+        **options: Any,
+    ) -> ModuleType:
+        from .instrumentation import Instrumentation
+
+        instrumentation = Instrumentation(functools.partial(self.trace, **options), include, exclude, operation_name)
+        return instrumentation.instrument_module(module)
@@ -59,7 +59,7 @@ setup(
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3 :: Only",
     ],
-    install_requires=["opentracing>=2.4.0,<3.0", "flatten-dict==0.3.0"],
+    install_requires=["opentracing>=2.4.0,<3.0"],
     test_suite="tests",
     extras_require={"tests": []},
     zip_safe=False,
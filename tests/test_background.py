@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import unittest
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.background import BackgroundSerializer, snapshot
+from opentracing_decorator.tracing import Tracing
+
+
+class TestBackgroundSerializer(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+
+    def blocked_serializer(self, when_full):
+        serializer = BackgroundSerializer(max_pending=1, when_full=when_full)
+        self.addCleanup(serializer.shutdown)
+        release = threading.Event()
+
+        def block() -> None:
+            release.wait()
+
+        serializer.submit(self.tracer.start_span("Blocker"), [block])
+        return serializer, release
+
+    def test_span_finished_after_payloads(self):
+        serializer = BackgroundSerializer()
+        self.addCleanup(serializer.shutdown)
+        span = self.tracer.start_span("TestSpan")
+
+        serializer.submit(span, [lambda: span.set_tag("a", 1)], finish_time=123.0)
+        serializer.flush()
+
+        finished = self.tracer.finished_spans()[0]
+        self.assertEqual(finished.tags, {"a": 1})
+        self.assertEqual(finished.finish_time, 123.0)
+
+    def test_drop_when_full(self):
+        serializer, release = self.blocked_serializer("drop")
+        span = self.tracer.start_span("TestSpan")
+        payload = MagicMock()
+
+        serializer.submit(span, [payload])
+
+        payload.assert_not_called()
+        self.assertEqual(serializer.dropped, 1)
+        self.assertEqual(self.tracer.finished_spans(), [span])
+        release.set()
+        serializer.flush()
+
+    def test_inline_when_full(self):
+        serializer, release = self.blocked_serializer("inline")
+        span = self.tracer.start_span("TestSpan")
+        payload = MagicMock()
+
+        serializer.submit(span, [payload])
+
+        payload.assert_called_once()
+        self.assertEqual(serializer.inlined, 1)
+        release.set()
+        serializer.flush()
+
+    def test_block_when_full(self):
+        serializer, release = self.blocked_serializer("block")
+        threading.Timer(0.05, release.set).start()
+        payload = MagicMock()
+
+        serializer.submit(self.tracer.start_span("TestSpan"), [payload])
+        serializer.flush()
+
+        payload.assert_called_once()
+        self.assertEqual(serializer.dropped, 0)
+
+    def test_failing_payload_still_finishes_span(self):
+        serializer = BackgroundSerializer()
+        self.addCleanup(serializer.shutdown)
+
+        with self.assertLogs("opentracing_decorator.background"):
+            serializer.submit(self.tracer.start_span("TestSpan"), [MagicMock(side_effect=TypeError())])
+            serializer.flush()
+
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, BackgroundSerializer, when_full="wait")
+
+    def test_snapshot(self):
+        value: Dict[str, Any] = {"a": [1], "b": 2}
+        copied = snapshot(value)
+        value["a"].append(2)
+        value["b"] = 3
+        self.assertEqual(copied, {"a": [1], "b": 2})
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.serializer = BackgroundSerializer()
+        self.addCleanup(self.serializer.shutdown)
+        self.tracing = Tracing(self.tracer, serializer=self.serializer)
+
+    def test_trace(self):
+        def func(x, y):
+            return {"sum": x + y}
+
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True, log_return=True)
+
+        self.assertEqual(traced_func(1, y=2), {"sum": 3})
+        self.serializer.flush()
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags, {"x": 1, "y": 2})
+        self.assertEqual(span.logs[0].key_values, {"return.sum": 3})
+
+    def test_trace_async(self):
+        async def func(x):
+            return x
+
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True, log_return=True)
+
+        self.assertEqual(asyncio.run(traced_func(1)), 1)
+        self.serializer.flush()
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags, {"x": 1})
+        self.assertEqual(span.logs[0].key_values, {"return": 1})
+
+    def test_trace_exception(self):
+        func = MagicMock(side_effect=ValueError())
+        traced_func = self.tracing.trace("TestTrace", func)
+
+        self.assertRaises(ValueError, traced_func)
+        self.serializer.flush()
+
+        self.assertTrue(self.tracer.finished_spans()[0].tags["error"])
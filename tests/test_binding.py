@@ -0,0 +1,192 @@
+import inspect
+import unittest
+
+from opentracing_decorator.binding import (
+    ParameterBinder,
+    ParameterExtractor,
+    outermost_paths,
+)
+
+
+def reference(func, *args, **kwargs):
+    bound_arguments = inspect.signature(func).bind(*args, **kwargs)
+    bound_arguments.apply_defaults()
+    return {key: value for key, value in bound_arguments.arguments.items() if key not in ("self", "cls")}
+
+
+class TestParameterBinder(unittest.TestCase):
+    def assertMatchesReference(self, func, *args, **kwargs):
+        result = ParameterBinder(func)(args, kwargs)
+        correct = reference(func, *args, **kwargs)
+        self.assertDictEqual(result, correct)
+        self.assertEqual(list(result), list(correct))
+
+    def test_simple(self):
+        def func(x, y, z):
+            pass
+
+        self.assertMatchesReference(func, 1, 2, 3)
+        self.assertMatchesReference(func, 1, z=3, y=2)
+
+    def test_defaults(self):
+        def func(x, y=2, z=None):
+            pass
+
+        self.assertMatchesReference(func, 1)
+        self.assertMatchesReference(func, 1, z=5)
+
+    def test_var_positional(self):
+        def func(x, *args):
+            pass
+
+        self.assertMatchesReference(func, 1)
+        self.assertMatchesReference(func, 1, 2, 3)
+
+    def test_var_keyword(self):
+        def func(x, **kwargs):
+            pass
+
+        self.assertMatchesReference(func, 1)
+        self.assertMatchesReference(func, 1, a=2, b=3)
+        self.assertMatchesReference(func, x=1, kwargs=2)
+
+    def test_keyword_only(self):
+        def func(x, *, y, z=3):
+            pass
+
+        self.assertMatchesReference(func, 1, y=2)
+        self.assertMatchesReference(func, z=4, y=2, x=1)
+
+    def test_everything(self):
+        def func(a, b=2, *args, c, d=4, **kwargs):
+            pass
+
+        self.assertMatchesReference(func, 1, c=3)
+        self.assertMatchesReference(func, 1, 2, 3, 4, c=3, e=5)
+
+    def test_self_and_cls_dropped(self):
+        class Example:
+            def method(self, x):
+                pass
+
+            @classmethod
+            def class_method(cls, x):
+                pass
+
+        self.assertDictEqual(ParameterBinder(Example.method)((Example(), 1), {}), {"x": 1})
+        class_method = Example.__dict__["class_method"].__func__
+        self.assertDictEqual(ParameterBinder(class_method)((Example, 1), {}), {"x": 1})
+
+    def test_ignored_may_be_missing(self):
+        def func(x, span):
+            pass
+
+        self.assertDictEqual(ParameterBinder(func, frozenset({"span"}))((1,), {}), {"x": 1})
+
+    def test_bound_method(self):
+        class Example:
+            def method(self, x, y=2):
+                pass
+
+        self.assertMatchesReference(Example().method, 1)
+
+    def test_missing(self):
+        def func(x, y):
+            pass
+
+        self.assertRaises(TypeError, ParameterBinder(func), (1,), {})
+
+    def test_too_many(self):
+        def func(x):
+            pass
+
+        self.assertRaises(TypeError, ParameterBinder(func), (1, 2), {})
+
+    def test_multiple_values(self):
+        def func(x):
+            pass
+
+        self.assertRaises(TypeError, ParameterBinder(func), (1,), {"x": 2})
+
+    def test_unexpected_keyword(self):
+        def func(x):
+            pass
+
+        self.assertRaises(TypeError, ParameterBinder(func), (1,), {"y": 2})
+
+    def test_missing_keyword_only(self):
+        def func(*, x):
+            pass
+
+        self.assertRaises(TypeError, ParameterBinder(func), (), {})
+
+
+class Order:
+    def __init__(self, id, lines):
+        self.id = id
+        self.lines = lines
+
+    @property
+    def broken(self):
+        raise RuntimeError()
+
+
+class TestParameterExtractor(unittest.TestCase):
+    def test_names(self):
+        def func(user_id, request, *, verbose=False):
+            pass
+
+        extract = ParameterExtractor(func, ["user_id", "verbose"])
+
+        self.assertDictEqual(extract((1, object()), {}), {"user_id": 1, "verbose": False})
+        self.assertDictEqual(
+            extract((), {"user_id": 2, "request": None, "verbose": True}), {"user_id": 2, "verbose": True}
+        )
+
+    def test_dotted_paths(self):
+        def func(order, payload):
+            pass
+
+        extract = ParameterExtractor(func, ["order.id", "order.lines.1", "payload.user.name"])
+        order = Order(7, ["a", "b"])
+
+        self.assertDictEqual(
+            extract((order, {"user": {"name": "ada"}}), {}),
+            {"order.id": 7, "order.lines.1": "b", "payload.user.name": "ada"},
+        )
+
+    def test_unresolvable_paths_skipped(self):
+        def func(order, payload=None, *args, **kwargs):
+            pass
+
+        extract = ParameterExtractor(func, ["order.missing", "order.lines.5", "order.broken", "payload.key", "extra"])
+
+        self.assertDictEqual(extract((Order(7, []),), {}), {})
+        self.assertDictEqual(extract((Order(7, []),), {"extra": 1}), {"extra": 1})
+
+    def test_unknown_parameter_dropped(self):
+        def func(x):
+            pass
+
+        self.assertDictEqual(ParameterExtractor(func, ["y", "x"])((1,), {}), {"x": 1})
+
+    def test_excluded(self):
+        def func(user_id, password):
+            pass
+
+        extract = ParameterExtractor(func, ["user_id", "password", "password.hash"], frozenset({"password"}))
+
+        self.assertDictEqual(extract((1, "secret"), {}), {"user_id": 1})
+
+    def test_outermost_paths(self):
+        self.assertEqual(
+            outermost_paths(["order.id", "order", "user", "order", "username"]), ["order", "user", "username"]
+        )
+
+    def test_var_arguments(self):
+        def func(x, *args, y, **kwargs):
+            pass
+
+        extract = ParameterExtractor(func, ["args.0", "kwargs"])
+
+        self.assertDictEqual(extract((1, 2, 3), {"y": 4, "z": 5}), {"args.0": 2, "kwargs": {"z": 5}})
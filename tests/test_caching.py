@@ -0,0 +1,135 @@
+import enum
+import unittest
+from dataclasses import dataclass
+from unittest.mock import patch
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator import flattening as flattening_module
+from opentracing_decorator.caching import PayloadCache
+from opentracing_decorator.tracing import Tracing
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@dataclass(frozen=True)
+class Config:
+    retries: int
+    hosts: tuple
+
+
+class Settings:
+    def __init__(self, version):
+        self.version = version
+
+
+class TestPayloadCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PayloadCache(immutable_types=[Settings])
+
+    def test_value_keys(self):
+        self.assertEqual(self.cache.value_key(1), (int, 1))
+        self.assertNotEqual(self.cache.value_key(1), self.cache.value_key(True))
+        self.assertIsNotNone(self.cache.value_key(Color.RED))
+        self.assertIsNotNone(self.cache.value_key(Config(3, ("a",))))
+        self.assertEqual(self.cache.value_key((1, "a")), (tuple, ((int, 1), (str, "a"))))
+
+    def test_equal_values_of_other_types_not_shared(self):
+        key = self.cache.value_key
+
+        self.assertNotEqual(key((1, 2)), key((True, 2.0)))
+        self.assertNotEqual(key(frozenset({1})), key(frozenset({True})))
+        self.assertNotEqual(key(((1,),)), key(((1.0,),)))
+        self.assertNotEqual(key(0.0), key(-0.0))
+        self.assertNotEqual(key(complex(0.0, 0.0)), key(complex(0.0, -0.0)))
+        self.assertNotEqual(key(Config(1, ())), key(Config(True, ())))
+        self.assertEqual(key(0.5), key(0.5))
+
+    def test_mutable_values_not_cached(self):
+        self.assertIsNone(self.cache.value_key([1]))
+        self.assertIsNone(self.cache.value_key({"a": 1}))
+        self.assertIsNone(self.cache.value_key(([1],)))
+        self.assertIsNone(self.cache.value_key(Config(3, ([1],))))
+        self.assertIsNone(self.cache.value_key(object()))
+        self.assertIsNone(self.cache.key("options", {"a": 1, "b": [2]}))
+
+    def test_identity_and_version(self):
+        settings = Settings(1)
+        key = self.cache.value_key(settings)
+
+        self.assertEqual(key, self.cache.value_key(settings))
+        self.assertNotEqual(key, self.cache.value_key(Settings(1)))
+        settings.version = 2
+        self.assertNotEqual(key, self.cache.value_key(settings))
+
+    def test_lru_eviction(self):
+        cache = PayloadCache(max_entries=2)
+        cache.put("a", {"a": 1})
+        cache.put("b", {"b": 1})
+        cache.get("a")
+        cache.put("c", {"c": 1})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((len(cache), cache.evictions), (2, 1))
+
+    def test_memory_cap(self):
+        cache = PayloadCache(max_bytes=2000)
+        for index in range(50):
+            cache.put(index, {"value": index})
+
+        self.assertLessEqual(cache.size_bytes, 2000)
+        self.assertGreater(cache.evictions, 0)
+        cache.put("large", {"value": "x" * 5000})
+        self.assertIsNone(cache.get("large"))
+
+    def test_invalid_limits(self):
+        self.assertRaises(ValueError, PayloadCache, 0)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.cache = PayloadCache()
+        self.tracing = Tracing(self.tracer, payload_cache=self.cache)
+
+    def test_repeated_parameters_served_from_cache(self):
+        def func(config, color):
+            pass
+
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True, parameter_prefix="args")
+        config = Config(3, ("a", "b"))
+
+        with patch.object(flattening_module, "flatten", wraps=flattening_module.flatten) as flatten:
+            traced_func(config, Color.RED)
+            traced_func(config, Color.RED)
+
+        self.assertEqual(flatten.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        first, second = self.tracer.finished_spans()
+        self.assertDictEqual(first.tags, second.tags)
+        self.assertEqual(first.tags["args.color"], "Color.RED")
+
+    def test_return_served_from_cache(self):
+        traced_func = self.tracing.trace("TestTrace", lambda: ("a", 1), log_return=True)
+
+        traced_func()
+        traced_func()
+
+        first, second = self.tracer.finished_spans()
+        self.assertEqual(first.logs[0].key_values, {"return": ["a", 1]})
+        self.assertEqual(second.logs[0].key_values, first.logs[0].key_values)
+        self.assertIsNot(second.logs[0].key_values, first.logs[0].key_values)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_different_options_not_shared(self):
+        def func(x):
+            pass
+
+        self.tracing.trace("TestTrace", func, tag_parameters=True)(1)
+        self.tracing.trace("TestTrace", func, tag_parameters=True, parameter_prefix="p")(1)
+
+        self.assertEqual(self.cache.hits, 0)
+        self.assertDictEqual(self.tracer.finished_spans()[1].tags, {"p.x": 1})
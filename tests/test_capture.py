@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.background import BackgroundSerializer
+from opentracing_decorator.capture import CAPTURE_TAG, TailCapture
+from opentracing_decorator.tracing import Tracing
+
+
+class TestTailCapture(unittest.TestCase):
+    def test_fixed_threshold(self):
+        tail = TailCapture(0.5)
+
+        self.assertFalse(tail.is_slow(0.1))
+        self.assertTrue(tail.is_slow(0.5))
+
+    def test_percentile_threshold(self):
+        tail = TailCapture("p90", window=100, min_samples=50, refresh_every=10)
+
+        self.assertFalse(any(tail.is_slow(elapsed) for elapsed in range(49)))
+        for elapsed in range(49, 100):
+            tail.is_slow(elapsed)
+
+        self.assertEqual(tail.threshold, 90)
+        self.assertTrue(tail.is_slow(95))
+        self.assertFalse(tail.is_slow(50))
+
+    def test_window_is_bounded(self):
+        tail = TailCapture("p50", window=10, min_samples=10, refresh_every=10)
+
+        for elapsed in [100] * 10 + [1] * 10:
+            tail.is_slow(elapsed)
+
+        self.assertEqual(tail.threshold, 1)
+
+    def test_invalid_threshold(self):
+        for threshold in ("p0", "p100", "fast", -1):
+            self.assertRaises(ValueError, TailCapture, threshold)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer)
+
+    def test_fast_call_not_captured(self):
+        traced_func = self.tracing.trace(
+            "TestTrace", lambda x: x, tag_parameters=True, log_return=True, capture_threshold=60
+        )
+
+        traced_func(1)
+
+        span = self.tracer.finished_spans()[0]
+        self.assertDictEqual(span.tags, {})
+        self.assertEqual(span.logs, [])
+
+    def test_slow_call_captured(self):
+        traced_func = self.tracing.trace(
+            "TestTrace", lambda x: x, tag_parameters=True, log_return=True, capture_threshold=0
+        )
+
+        traced_func(1)
+
+        span = self.tracer.finished_spans()[0]
+        self.assertDictEqual(span.tags, {CAPTURE_TAG: "slow", "x": 1})
+        self.assertEqual(span.logs[0].key_values, {"return": 1})
+
+    def test_failed_call_captured(self):
+        def func(x):
+            raise ValueError()
+
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True, log_return=True, capture_threshold=60)
+
+        self.assertRaises(ValueError, traced_func, 1)
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags[CAPTURE_TAG], "error")
+        self.assertEqual(span.tags["x"], 1)
+        self.assertTrue(span.tags["error"])
+
+    def test_async_slow_call_captured(self):
+        async def func(x):
+            return x
+
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True, capture_threshold=0)
+
+        self.assertEqual(asyncio.run(traced_func(1)), 1)
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {CAPTURE_TAG: "slow", "x": 1})
+
+    def test_background_capture(self):
+        serializer = BackgroundSerializer()
+        tracing = Tracing(self.tracer, serializer=serializer)
+        slow = tracing.trace("Slow", lambda x: x, tag_parameters=True, capture_threshold=0)
+        fast = tracing.trace("Fast", lambda x: x, tag_parameters=True, capture_threshold=60)
+
+        slow(1)
+        fast(2)
+        serializer.flush()
+        serializer.shutdown()
+
+        spans = {span.operation_name: span for span in self.tracer.finished_spans()}
+        self.assertDictEqual(spans["Slow"].tags, {CAPTURE_TAG: "slow", "x": 1})
+        self.assertDictEqual(spans["Fast"].tags, {})
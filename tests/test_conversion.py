@@ -0,0 +1,82 @@
+import decimal
+import enum
+import json
+import math
+import unittest
+import uuid
+from collections import OrderedDict
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.conversion import safe_convert
+
+
+def reference(value):
+    return json.loads(json.dumps(value, default=str))
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+class Name(str):
+    pass
+
+
+class TestSafeConvert(unittest.TestCase):
+    def assertMatchesReference(self, value):
+        result = safe_convert(value)
+        correct = reference(value)
+        self.assertEqual(result, correct)
+        self.assertEqual(type(result), type(correct))
+
+    def test_primitives(self):
+        for value in ("a", 1, 1.5, True, False, None):
+            self.assertMatchesReference(value)
+
+    def test_subclasses(self):
+        for value in (Level.HIGH, Name("x"), OrderedDict(a=1)):
+            self.assertMatchesReference(value)
+
+    def test_unknown_types(self):
+        for value in (uuid.uuid4(), decimal.Decimal("1.1"), Color.RED, MockTracer(), {1, 2}, b"x"):
+            self.assertMatchesReference(value)
+
+    def test_containers(self):
+        self.assertMatchesReference({"a": [1, (2, 3), {"b": uuid.uuid4()}], "c": ()})
+
+    def test_keys(self):
+        self.assertMatchesReference({2: "a", 1.5: "b", True: "c", None: "d", Name("e"): "e", Level.HIGH: "f"})
+
+    def test_special_float_keys(self):
+        self.assertMatchesReference({float("inf"): 1, float("-inf"): 2})
+        self.assertEqual(list(safe_convert({float("nan"): 1})), ["NaN"])
+
+    def test_nan_value(self):
+        self.assertTrue(math.isnan(safe_convert({"a": float("nan")})["a"]))
+
+    def test_colliding_keys(self):
+        self.assertMatchesReference({1: "a", "1": "b"})
+
+    def test_non_str_key(self):
+        self.assertRaises(TypeError, safe_convert, {uuid.uuid4(): 1})
+        self.assertRaises(TypeError, safe_convert, {(1, 2): 1})
+
+    def test_circular_reference(self):
+        cyclic_list: list = [1]
+        cyclic_list.append(cyclic_list)
+        cyclic_dict: dict = {"a": 1}
+        cyclic_dict["b"] = [cyclic_dict]
+
+        for value in (cyclic_list, cyclic_dict):
+            self.assertRaises(ValueError, json.dumps, value, default=str)
+            self.assertRaises(ValueError, safe_convert, value)
+
+    def test_shared_reference_not_circular(self):
+        shared = [1]
+
+        self.assertMatchesReference({"a": shared, "b": [shared, shared]})
@@ -0,0 +1,109 @@
+import unittest
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.errors import StackFormatter
+from opentracing_decorator.tracing import Tracing
+
+
+def fail(depth=0):
+    if depth:
+        fail(depth - 1)
+    raise ValueError("failed")
+
+
+def caught(func, *args):
+    try:
+        func(*args)
+    except Exception as error:
+        return error
+
+
+class TestStackFormatter(unittest.TestCase):
+    def test_repeated_failures_cached(self):
+        stacks = StackFormatter()
+
+        formatted = [stacks.format(caught(fail)) for _ in range(5)]
+
+        self.assertEqual(len(set(formatted)), 1)
+        self.assertIn("fail", formatted[0])
+        self.assertEqual((stacks.hits, stacks.misses), (4, 1))
+
+    def test_different_locations_not_shared(self):
+        stacks = StackFormatter()
+
+        stacks.format(caught(fail))
+        stacks.format(caught(fail, 1))
+        stacks.format(caught(lambda: [][1]))
+
+        self.assertEqual(stacks.misses, 3)
+
+    def test_frame_limit(self):
+        stacks = StackFormatter(max_frames=3)
+
+        stack = stacks.format(caught(fail, 10))
+
+        self.assertEqual(stack.count("File "), 3)
+        self.assertIn('raise ValueError("failed")', stack)
+
+    def test_entries_bounded(self):
+        stacks = StackFormatter(max_entries=2)
+
+        for depth in range(4):
+            stacks.format(caught(fail, depth))
+        stacks.format(caught(fail, 0))
+
+        self.assertEqual(stacks.misses, 5)
+
+    def test_invalid_limits(self):
+        self.assertRaises(ValueError, StackFormatter, 0)
+        self.assertRaises(ValueError, StackFormatter, 1, 0)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer)
+
+    def test_exception_recorded(self):
+        traced_func = self.tracing.trace("TestTrace", fail)
+
+        self.assertRaises(ValueError, traced_func)
+
+        span = self.tracer.finished_spans()[0]
+        self.assertTrue(span.tags["error"])
+        self.assertEqual(len(span.logs), 1)
+        fields = span.logs[0].key_values
+        self.assertEqual(fields["event"], "error")
+        self.assertEqual(fields["error.kind"], "ValueError")
+        self.assertEqual(fields["message"], "failed")
+        self.assertIsInstance(fields["error.object"], ValueError)
+        self.assertIn('raise ValueError("failed")', fields["stack"])
+
+    def test_generator_exception_recorded_once(self):
+        def func():
+            yield 1
+            fail()
+
+        self.assertRaises(ValueError, list, self.tracing.trace("TestTrace", func)())
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(len(span.logs), 1)
+        self.assertEqual(span.logs[0].key_values["error.kind"], "ValueError")
+
+    def test_unsampled_span_only_tagged(self):
+        tracing = Tracing(self.tracer, is_recording=lambda span: False)
+
+        self.assertRaises(ValueError, tracing.trace("TestTrace", fail))
+
+        span = self.tracer.finished_spans()[0]
+        self.assertTrue(span.tags["error"])
+        self.assertEqual(span.logs, [])
+
+    def test_tracer_default_when_disabled(self):
+        tracing = Tracing(self.tracer, record_exceptions=False)
+
+        self.assertRaises(ValueError, tracing.trace("TestTrace", fail))
+
+        fields = self.tracer.finished_spans()[0].logs[0].key_values
+        self.assertIs(fields["error.kind"], ValueError)
@@ -0,0 +1,147 @@
+import unittest
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.flattening import FlattenBudget, flatten
+from opentracing_decorator.tracing import Tracing
+
+PAYLOAD = {
+    "a": 1,
+    "b": {"c": [1, 2, {"d": "text"}], "e": {}, "f": []},
+    "g": {"h": {"i": {"j": None}}},
+    "k": ({"l": 1},),
+}
+
+
+class TestFlatten(unittest.TestCase):
+    def test_dot(self):
+        result, truncated = flatten(PAYLOAD)
+        correct = {"a": 1, "b.c.0": 1, "b.c.1": 2, "b.c.2.d": "text", "g.h.i.j": None, "k": ({"l": 1},)}
+        self.assertEqual(list(result.items()), list(correct.items()))
+        self.assertFalse(truncated)
+
+    def test_underscore(self):
+        result, _ = flatten(PAYLOAD, "underscore")
+        correct = {"a": 1, "b_c_0": 1, "b_c_1": 2, "b_c_2_d": "text", "g_h_i_j": None, "k": ({"l": 1},)}
+        self.assertEqual(list(result.items()), list(correct.items()))
+
+    def test_path(self):
+        result, _ = flatten({"a": {"b": {"c": 1}, "/d": 2}}, "path")
+        self.assertEqual(result, {"a/b/c": 1, "/d": 2})
+
+    def test_tuple(self):
+        result, _ = flatten({"a": {"b": [1]}}, "tuple")
+        self.assertEqual(result, {("a", "b", 0): 1})
+
+    def test_callable_reducer(self):
+        result, _ = flatten({"a": {"b": 1}}, lambda parent, key: key if parent is None else f"{parent}:{key}")
+        self.assertEqual(result, {"a:b": 1})
+
+    def test_non_str_keys(self):
+        result, _ = flatten({1: 1, "x": {2: 1, 2000: 2, True: 3, None: 4, (1, 2): 5, 1.5: 6}, None: {"y": 7}})
+        correct = {1: 1, "x.2": 1, "x.2000": 2, "x.True": 3, "x.None": 4, "x.(1, 2)": 5, "x.1.5": 6, "y": 7}
+        self.assertEqual(result, correct)
+
+    def test_max_depth(self):
+        result, truncated = flatten(PAYLOAD, "dot", FlattenBudget(max_depth=2))
+        self.assertEqual(result, {"a": 1, "k": ({"l": 1},)})
+        self.assertTrue(truncated)
+
+    def test_max_keys(self):
+        result, truncated = flatten(PAYLOAD, "dot", FlattenBudget(max_keys=3))
+        self.assertEqual(result, {"a": 1, "b.c.0": 1, "b.c.1": 2})
+        self.assertTrue(truncated)
+
+    def test_max_keys_exact(self):
+        result, truncated = flatten({"a": 1, "b": 2}, "dot", FlattenBudget(max_keys=2))
+        self.assertEqual(result, {"a": 1, "b": 2})
+        self.assertFalse(truncated)
+
+    def test_max_keys_stops_walking(self):
+        def items():
+            yield "a", 1
+            yield "b", 2
+            raise AssertionError("walked past the key budget")
+
+        class Lazy(dict):
+            def items(self):
+                return items()
+
+        result, truncated = flatten(Lazy(a=1), "dot", FlattenBudget(max_keys=1))
+        self.assertEqual(result, {"a": 1})
+        self.assertTrue(truncated)
+
+    def test_max_list_items(self):
+        result, truncated = flatten({"x": list(range(50_000))}, "dot", FlattenBudget(max_list_items=2))
+        self.assertEqual(result, {"x.0": 0, "x.1": 1})
+        self.assertTrue(truncated)
+
+    def test_max_string_length(self):
+        result, truncated = flatten({"x": "abcdef", "y": "ab"}, "dot", FlattenBudget(max_string_length=3))
+        self.assertEqual(result, {"x": "abc", "y": "ab"})
+        self.assertTrue(truncated)
+
+    def test_duplicated_key(self):
+        self.assertRaises(ValueError, flatten, {"a.b": 1, "a": {"b": 2}}, "dot", FlattenBudget())
+
+    def test_cycles_skipped(self):
+        cyclic_dict: dict = {"x": 1}
+        cyclic_dict["a"] = cyclic_dict
+        cyclic_list: list = [1]
+        cyclic_list.append({"b": cyclic_list})
+
+        for reducer in ("dot", "tuple"):
+            result, truncated = flatten({"d": cyclic_dict, "l": cyclic_list}, reducer)
+            self.assertEqual(len(result), 2)
+            self.assertTrue(truncated)
+        self.assertEqual(flatten(cyclic_dict)[0], {"x": 1})
+        self.assertEqual(flatten({"l": cyclic_list})[0], {"l.0": 1})
+
+    def test_shared_containers_walked(self):
+        shared = {"x": 1}
+
+        result, truncated = flatten({"a": shared, "b": [shared, shared]})
+        self.assertEqual(result, {"a.x": 1, "b.0.x": 1, "b.1.x": 1})
+        self.assertFalse(truncated)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+
+    def test_decorator_budget(self):
+        tracing = Tracing(self.tracer)
+
+        def func(x):
+            return x
+
+        traced_func = tracing.trace(
+            "TestTrace", func, tag_parameters=True, log_return=True, flatten_budget=FlattenBudget(max_list_items=1)
+        )
+        traced_func([1, 2])
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags, {"x.0": 1, "_truncated": True})
+        self.assertEqual(span.logs[0].key_values, {"return.0": 1, "_truncated": True})
+
+    def test_global_budget(self):
+        tracing = Tracing(self.tracer, flatten_budget=FlattenBudget(max_keys=1))
+
+        def func(x, y):
+            pass
+
+        tracing.trace("TestTrace", func, tag_parameters=True)(1, 2)
+        tracing.trace("TestTrace", func, tag_parameters=True, flatten_budget=FlattenBudget())(1, 2)
+
+        first, second = self.tracer.finished_spans()
+        self.assertEqual(first.tags, {"x": 1, "_truncated": True})
+        self.assertEqual(second.tags, {"x": 1, "y": 2})
+
+    def test_cyclic_parameter(self):
+        tracing = Tracing(self.tracer)
+        cyclic: dict = {"x": 1}
+        cyclic["self"] = cyclic
+
+        tracing.trace("TestTrace", lambda value: value, tag_parameters=True)(cyclic)
+
+        self.assertEqual(self.tracer.finished_spans()[0].tags, {"value.x": 1, "_truncated": True})
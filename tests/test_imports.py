@@ -0,0 +1,119 @@
+import functools
+import json
+import subprocess
+import sys
+import unittest
+from typing import Callable, List, Tuple
+
+from opentracing_decorator import tracing
+
+HEAVY_MODULES = [
+    "concurrent.futures",
+    "inspect",
+    "logging",
+    "multiprocessing",
+    "opentracing_decorator.background",
+    "opentracing_decorator.binding",
+    "opentracing_decorator.caching",
+    "opentracing_decorator.capture",
+    "opentracing_decorator.conversion",
+    "opentracing_decorator.flattening",
+    "opentracing_decorator.instrumentation",
+    "opentracing_decorator.naming",
+    "opentracing_decorator.propagation",
+    "opentracing_decorator.summarizing",
+]
+
+
+def imported_modules(code):
+    """
+    The modules in `HEAVY_MODULES` that running `code` in a fresh interpreter
+    imports, leaving out the ones the interpreter had already imported.
+    """
+    script = (
+        "import json, sys\n"
+        f"before = set(sys.modules)\n{code}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in before]))"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout))
+
+
+class TestImports(unittest.TestCase):
+    def test_import_is_lazy(self):
+        self.assertSetEqual(imported_modules("import opentracing_decorator"), set())
+
+    def test_lazy_attributes(self):
+        modules = imported_modules(
+            "import opentracing_decorator\n"
+            "assert opentracing_decorator.PayloadCache.__module__ == 'opentracing_decorator'\n"
+            "assert 'Tracing' in dir(opentracing_decorator)"
+        )
+        self.assertSetEqual(modules, {"opentracing_decorator.caching"})
+
+    def test_plain_decorator_skips_serialization(self):
+        code = (
+            "from opentracing_decorator import Tracing\n"
+            "tracing = Tracing()\n"
+            "traced = tracing.trace('Test', lambda x: x)\n"
+            "traced(1)\n"
+            "async def coroutine(): pass\n"
+            "tracing.trace('Test', coroutine)\n"
+            "def generator(): yield\n"
+            "list(tracing.trace('Test', generator)())"
+        )
+        self.assertSetEqual(imported_modules(code), set())
+
+    def test_tag_parameters_imports_serialization(self):
+        code = (
+            "from opentracing.mocktracer import MockTracer\n"
+            "from opentracing_decorator import Tracing\n"
+            "traced = Tracing(MockTracer()).trace('Test', lambda x: x, tag_parameters=True, log_return=True)\n"
+            "traced(1)"
+        )
+        modules = imported_modules(code)
+        self.assertTrue(
+            {
+                "opentracing_decorator.binding",
+                "opentracing_decorator.conversion",
+                "opentracing_decorator.flattening",
+            }.issubset(modules)
+        )
+
+    def test_code_flags_match_inspect(self):
+        class Example:
+            def method(self):
+                pass
+
+            async def coroutine(self):
+                pass
+
+            def generator(self):
+                yield
+
+            async def async_generator(self):
+                yield
+
+        example = Example()
+        # (function, is a generator function, is a coroutine function), written
+        # out since `inspect` doesn't unwrap partials before Python 3.8.
+        functions: List[Tuple[Callable, bool, bool]] = [
+            (example.method, False, False),
+            (example.coroutine, False, True),
+            (example.generator, True, False),
+            (example.async_generator, True, False),
+            (Example.coroutine, False, True),
+            (functools.partial(Example.coroutine, example), False, True),
+            (functools.partial(Example.generator, example), True, False),
+            (len, False, False),
+        ]
+        for func, is_generator, is_coroutine in functions:
+            self.assertEqual(tracing._is_generator_function(func), is_generator)
+            self.assertEqual(tracing._has_code_flag(func, tracing._CO_COROUTINE), is_coroutine)
+            self.assertEqual(tracing._is_coroutine_function(func), is_coroutine)
+
+    def test_unknown_attribute(self):
+        import opentracing_decorator
+
+        with self.assertRaises(AttributeError):
+            opentracing_decorator.Missing
@@ -0,0 +1,140 @@
+import asyncio
+import types
+import unittest
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.tracing import Tracing
+
+
+def make_service():
+    class Service:
+        def get_user(self, user_id):
+            return user_id
+
+        def delete_user(self, user_id):
+            return user_id
+
+        async def fetch(self, x):
+            return x
+
+        @staticmethod
+        def helper(x):
+            return x
+
+        @classmethod
+        def create(cls, x):
+            return x
+
+        @property
+        def name(self):
+            return "service"
+
+        def _private(self):
+            return None
+
+    return Service
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer)
+
+    def operation_names(self):
+        return [span.operation_name for span in self.tracer.finished_spans()]
+
+    def test_trace_class(self):
+        Service = self.tracing.trace_class(make_service(), tag_parameters=True)
+        service = Service()
+
+        self.assertEqual(service.get_user(1), 1)
+        self.assertEqual(asyncio.run(service.fetch(2)), 2)
+        self.assertEqual(Service.helper(3), 3)
+        self.assertEqual(service.create(4), 4)
+        self.assertEqual(service.name, "service")
+        service._private()
+
+        self.assertEqual(
+            self.operation_names(),
+            [
+                "make_service.<locals>.Service.get_user",
+                "make_service.<locals>.Service.fetch",
+                "make_service.<locals>.Service.helper",
+                "make_service.<locals>.Service.create",
+                "make_service.<locals>.Service.name",
+            ],
+        )
+        self.assertEqual(
+            [span.tags for span in self.tracer.finished_spans()][:4], [{"user_id": 1}, {"x": 2}, {"x": 3}, {"x": 4}]
+        )
+
+    def test_include_exclude(self):
+        Service = self.tracing.trace_class(
+            make_service(), include=["*_user", "helper"], exclude=["delete_*"], operation_name="svc.{name}"
+        )
+        service = Service()
+        service.get_user(1)
+        service.delete_user(1)
+        service.helper(1)
+        service.create(1)
+
+        self.assertEqual(self.operation_names(), ["svc.get_user", "svc.helper"])
+
+    def test_class_decorator(self):
+        @self.tracing.trace_class(include=["get*"])
+        class Service:
+            def get(self):
+                return 1
+
+        Service().get()
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_not_traced_twice(self):
+        Service = make_service()
+        self.tracing.trace_class(Service)
+        self.tracing.trace_class(Service)
+        Service().get_user(1)
+
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_hand_decorated_methods_kept(self):
+        tracing = self.tracing
+
+        @tracing.trace_class(operation_name="svc.{name}")
+        class Service:
+            @tracing.trace("manual")
+            def traced(self):
+                pass
+
+            @staticmethod
+            @tracing.trace("manual_static")
+            def traced_static():
+                pass
+
+            def plain(self):
+                pass
+
+        Service().traced()
+        Service.traced_static()
+        Service().plain()
+
+        self.assertEqual(self.operation_names(), ["manual", "manual_static", "svc.plain"])
+
+    def test_trace_module(self):
+        module = types.ModuleType("service_module")
+        exec(
+            "import json\n"
+            "def handle(x):\n    return x\n"
+            "def _internal(x):\n    return x\n"
+            "class Handler:\n    def run(self):\n        return 1\n",
+            module.__dict__,
+        )
+
+        self.tracing.trace_module(module, operation_name="{module}.{qualname}")
+        module.handle(1)
+        module._internal(1)
+        module.Handler().run()
+        module.json.dumps(1)
+
+        self.assertEqual(self.operation_names(), ["service_module.handle", "service_module.Handler.run"])
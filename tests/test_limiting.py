@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.limiting import RateLimiter
+from opentracing_decorator.tracing import Tracing
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_then_suppress(self):
+        with patch("opentracing_decorator.limiting.time.monotonic", return_value=0.0):
+            limiter = RateLimiter(rate=2)
+            self.assertEqual(limiter.acquire(), 0)
+            self.assertEqual(limiter.acquire(), 0)
+            self.assertIsNone(limiter.acquire())
+            self.assertIsNone(limiter.acquire())
+
+        with patch("opentracing_decorator.limiting.time.monotonic", return_value=0.5):
+            self.assertEqual(limiter.acquire(), 2)
+            self.assertIsNone(limiter.acquire())
+
+        self.assertEqual(limiter.total_suppressed, 3)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, RateLimiter, rate=0)
+        self.assertRaises(ValueError, RateLimiter, rate=1, burst=0.5)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+
+    def test_decorator_rate_limit(self):
+        tracing = Tracing(self.tracer)
+        func = MagicMock(return_value=3)
+        traced_func = tracing.trace("TestTrace", func, rate_limit=RateLimiter(rate=1e-9, burst=1))
+
+        results = [traced_func() for _ in range(5)]
+
+        self.assertEqual(results, [3] * 5)
+        self.assertEqual(func.call_count, 5)
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_suppressed_calls_reported(self):
+        tracing = Tracing(self.tracer, rate_limit=1)
+
+        with patch("opentracing_decorator.limiting.time.monotonic", return_value=0.0):
+            traced_func = tracing.trace("TestTrace", MagicMock())
+            for _ in range(4):
+                traced_func()
+        with patch("opentracing_decorator.limiting.time.monotonic", return_value=1.0):
+            traced_func()
+
+        first, second = self.tracer.finished_spans()
+        self.assertNotIn("tracing.suppressed_calls", first.tags)
+        self.assertEqual(second.tags["tracing.suppressed_calls"], 3)
+
+    def test_shared_per_operation(self):
+        tracing = Tracing(self.tracer, rate_limit=1)
+        tracing.trace("TestTrace", MagicMock())()
+        tracing.trace("TestTrace", MagicMock())()
+        tracing.trace("OtherTrace", MagicMock())()
+
+        self.assertEqual([span.operation_name for span in self.tracer.finished_spans()], ["TestTrace", "OtherTrace"])
+
+    def test_suppressed_pass_span(self):
+        tracing = Tracing(self.tracer)
+        func = MagicMock()
+        traced_func = tracing.trace("TestTrace", func, pass_span=True, rate_limit=RateLimiter(rate=1e-9, burst=1))
+        traced_func()
+        traced_func()
+
+        self.assertIsNot(func.call_args[1]["span"], self.tracer.finished_spans()[0])
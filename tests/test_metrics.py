@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.metrics import MetricsAggregator
+from opentracing_decorator.tracing import Tracing
+
+
+class TestMetricsAggregator(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsAggregator(bucket_bounds_ns=(10, 100, 1000))
+
+    def test_snapshot(self):
+        for elapsed in (5, 50, 50, 500, 5000):
+            self.metrics.record("Op", elapsed)
+        self.metrics.record("Op", 50, error=True)
+
+        summary = self.metrics.snapshot()["Op"]
+
+        self.assertEqual(summary["count"], 6)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["total_ns"], 5655)
+        self.assertEqual(summary["buckets"], {10: 1, 100: 3, 1000: 1, "inf": 1})
+        self.assertEqual(summary["p50_ns"], 100)
+        self.assertEqual(summary["p90_ns"], None)
+
+    def test_threads_merged(self):
+        def record():
+            for _ in range(1000):
+                self.metrics.record("Op", 1)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.metrics.snapshot()["Op"]["count"], 4000)
+
+    def test_exited_threads_retired(self):
+        self.metrics.record("Op", 5)
+        threads = [threading.Thread(target=self.metrics.record, args=("Op", 50)) for _ in range(50)]
+        delta = self.metrics.delta()
+        for thread in threads:
+            thread.start()
+            thread.join()
+
+        self.assertEqual(len(self.metrics._shards), 1)
+        self.assertEqual(self.metrics.snapshot()["Op"]["buckets"], {10: 1, 100: 50, 1000: 0, "inf": 0})
+        self.assertEqual(delta["Op"]["count"], 1)
+        self.assertEqual(self.metrics.delta()["Op"]["count"], 50)
+
+    def test_delta(self):
+        self.metrics.record("Op", 5)
+        self.assertEqual(self.metrics.delta()["Op"]["count"], 1)
+
+        self.assertEqual(self.metrics.delta(), {})
+
+        self.metrics.record("Op", 500)
+        self.metrics.record("Op", 500)
+        delta = self.metrics.delta()["Op"]
+        self.assertEqual((delta["count"], delta["total_ns"]), (2, 1000))
+        self.assertEqual(delta["buckets"], {10: 0, 100: 0, 1000: 2, "inf": 0})
+
+    def test_reset(self):
+        self.metrics.record("Op", 5)
+        self.metrics.reset()
+
+        self.assertEqual(self.metrics.snapshot(), {})
+
+    def test_claim_emit(self):
+        self.assertFalse(self.metrics.claim_emit(10**18))
+
+        metrics = MetricsAggregator(interval=1)
+        due = metrics.next_emit_ns
+        assert due is not None
+        self.assertFalse(metrics.claim_emit(due - 1))
+        self.assertTrue(metrics.claim_emit(due))
+        self.assertFalse(metrics.claim_emit(due))
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer)
+
+    def test_measure_starts_no_spans(self):
+        @self.tracing.measure("Op")
+        def func(x):
+            if x < 0:
+                raise ValueError()
+            return x
+
+        self.assertEqual([func(1) for _ in range(3)], [1, 1, 1])
+        self.assertRaises(ValueError, func, -1)
+
+        self.assertEqual(self.tracer.finished_spans(), [])
+        summary = self.tracing.metrics.snapshot()["Op"]
+        self.assertEqual((summary["count"], summary["errors"]), (4, 1))
+
+    def test_measure_async(self):
+        async def func():
+            return 1
+
+        measured = self.tracing.measure("Op", func)
+
+        self.assertEqual(asyncio.run(measured()), 1)
+        self.assertEqual(self.tracing.metrics.snapshot()["Op"]["count"], 1)
+
+    def test_measure_generator_rejected(self):
+        def func():
+            yield 1
+
+        self.assertRaises(ValueError, self.tracing.measure, "Op", func)
+
+    def test_emit_metrics(self):
+        measured = self.tracing.measure("Op", lambda: None)
+        measured()
+        measured()
+
+        self.tracing.emit_metrics()
+        self.tracing.emit_metrics()
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+        self.assertEqual(span.operation_name, "Op")
+        self.assertEqual(span.tags["metrics.count"], 2)
+        self.assertEqual(span.tags["metrics.errors"], 0)
+        self.assertIn("metrics.p99_ns", span.tags)
+
+    def test_emit_ignores_active_span(self):
+        measured = self.tracing.measure("Op", lambda: None)
+        measured()
+
+        with self.tracer.start_active_span("Request"):
+            self.tracing.emit_metrics()
+
+        summary = self.tracer.finished_spans()[0]
+        self.assertEqual(summary.operation_name, "Op")
+        self.assertIsNone(summary.parent_id)
+
+    def test_periodic_emit(self):
+        tracing = Tracing(self.tracer, metrics_interval=60)
+        measured = tracing.measure("Op", lambda: None)
+        measured()
+
+        with patch("opentracing_decorator.tracing.time.perf_counter_ns", return_value=tracing.metrics.next_emit_ns):
+            measured()
+
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+        self.assertEqual(self.tracer.finished_spans()[0].tags["metrics.count"], 2)
+
+    def test_disabled(self):
+        self.tracing.disable()
+        self.tracing.measure("Op", lambda: None)()
+
+        self.assertEqual(self.tracing.metrics.snapshot(), {})
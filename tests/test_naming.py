@@ -0,0 +1,56 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from opentracing_decorator.naming import OperationNamer
+
+
+def handle(event, retries=0):
+    pass
+
+
+def compile_namer(*args: Any, **kwargs: Any) -> OperationNamer:
+    namer = OperationNamer.compile(handle, *args, **kwargs)
+    assert namer is not None
+    return namer
+
+
+class TestOperationNamer(unittest.TestCase):
+    def test_fixed_name(self):
+        self.assertIsNone(OperationNamer.compile(handle, "Handle"))
+        self.assertIsNone(OperationNamer.compile(handle, "Handle {"))
+        self.assertIsNone(OperationNamer.compile(handle, "Handle {{event}}"))
+
+    def test_template(self):
+        namer = compile_namer("handle:{event.type}:{retries:02d}")
+
+        self.assertEqual(namer((SimpleNamespace(type="created"),), {}), "handle:created:00")
+        self.assertEqual(namer(({"type": "deleted"},), {"retries": 3}), "handle:deleted:03")
+
+    def test_template_with_parent_and_nested_field(self):
+        namer = compile_namer("{event!r}/{event.type}")
+
+        self.assertEqual(namer(({"type": "x"},), {}), "{'type': 'x'}/x")
+
+    def test_unresolved_field_falls_back(self):
+        namer = compile_namer("handle:{event.type}")
+
+        self.assertEqual(namer((object(),), {}), "handle:{event.type}")
+        self.assertEqual(compile_namer("{missing}", fallback="Handle")((1,), {}), "Handle")
+
+    def test_callable(self):
+        namer = compile_namer(lambda event, retries=0: f"handle:{event}")
+
+        self.assertEqual(namer(("a",), {}), "handle:a")
+        self.assertEqual(namer((), {}), "handle")
+
+    def test_cardinality_guard(self):
+        namer = compile_namer("handle:{event}", max_names=2, fallback="handle:other")
+
+        names = [namer((event,), {}) for event in ["a", "b", "c", "a", "d"]]
+
+        self.assertEqual(names, ["handle:a", "handle:b", "handle:other", "handle:a", "handle:other"])
+        self.assertEqual(namer.overflowed, 2)
+
+    def test_invalid_max_names(self):
+        self.assertRaises(ValueError, OperationNamer, handle, "{event}", 0)
@@ -0,0 +1,126 @@
+import inspect
+import unittest
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.flattening import REDUCERS, SEPARATORS
+from opentracing_decorator.options import REDUCER_NAMES, TraceOptions
+from opentracing_decorator.tracing import Tracing
+
+
+class TestTraceOptions(unittest.TestCase):
+    def test_defaults(self):
+        options = TraceOptions()
+
+        self.assertFalse(options.tag_parameters)
+        self.assertEqual(options.exclude_parameters, frozenset())
+        self.assertFalse(options.records_payload)
+
+    def test_normalized(self):
+        self.assertEqual(TraceOptions(tag_parameters="user.id").tag_parameters, ("user.id",))
+        self.assertEqual(TraceOptions(tag_parameters=["a", "b.c"]).tag_parameters, ("a", "b.c"))
+        self.assertIs(TraceOptions(tag_parameters=[]).tag_parameters, False)
+        self.assertEqual(TraceOptions(exclude_parameters=["a", "a"]).exclude_parameters, frozenset({"a"}))
+        self.assertTrue(TraceOptions(log_return=True).records_payload)
+        self.assertTrue(TraceOptions(tag_parameters=True).records_payload)
+
+    def test_validated(self):
+        self.assertRaises(ValueError, TraceOptions, yield_batch_size=0)
+        self.assertRaises(ValueError, TraceOptions, yield_sample_every=0)
+        self.assertRaises(ValueError, TraceOptions, max_operation_names=0)
+        self.assertRaises(ValueError, TraceOptions, parameter_reducer="bogus")
+        self.assertRaises(ValueError, TraceOptions, return_reducer="bogus")
+        self.assertRaises(ValueError, TraceOptions, exclude_parameters=["user.password"])
+        self.assertRaises(TypeError, TraceOptions, bogus=True)
+        TraceOptions(parameter_reducer=lambda parent, key: key)
+
+    def test_reducer_names_match_flattening(self):
+        self.assertEqual(REDUCER_NAMES, set(SEPARATORS) | set(REDUCERS))
+
+    def test_immutable(self):
+        options = TraceOptions()
+
+        with self.assertRaises(AttributeError):
+            options.log_return = True
+        with self.assertRaises(AttributeError):
+            del options.log_return
+        with self.assertRaises(AttributeError):
+            options.extra = 1
+
+    def test_replace(self):
+        options = TraceOptions(tag_parameters=True)
+        changed = options.replace(log_return=True)
+
+        self.assertIs(options.replace(), options)
+        self.assertFalse(options.log_return)
+        self.assertTrue(changed.log_return)
+        self.assertTrue(changed.tag_parameters)
+        self.assertRaises(ValueError, options.replace, yield_batch_size=0)
+        self.assertRaises(TypeError, options.replace, bogus=True)
+
+    def test_equality(self):
+        self.assertEqual(TraceOptions(tag_parameters="a"), TraceOptions(tag_parameters=("a",)))
+        self.assertEqual(hash(TraceOptions(log_return=True)), hash(TraceOptions(log_return=True)))
+        self.assertNotEqual(TraceOptions(), TraceOptions(log_return=True))
+        self.assertIn("log_return=True", repr(TraceOptions(log_return=True)))
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+
+    def test_shared_options(self):
+        options = TraceOptions(tag_parameters=True, parameter_prefix="args", log_return=True)
+        tracing = Tracing(self.tracer)
+
+        @tracing.trace("First", options=options)
+        def first(x):
+            return x
+
+        @tracing.trace("Second", options=options)
+        def second(y):
+            return y * 2
+
+        first(1)
+        second(2)
+
+        first_span, second_span = self.tracer.finished_spans()
+        self.assertDictEqual(first_span.tags, {"args.x": 1})
+        self.assertDictEqual(second_span.tags, {"args.y": 2})
+        self.assertDictEqual(second_span.logs[0].key_values, {"return": 4})
+
+    def test_default_options(self):
+        tracing = Tracing(self.tracer, options=TraceOptions(log_return=True))
+
+        tracing.trace("Default", lambda: 1)()
+        tracing.trace("Overridden", lambda: 1, log_return=False)()
+
+        default, overridden = self.tracer.finished_spans()
+        self.assertDictEqual(default.logs[0].key_values, {"return": 1})
+        self.assertEqual(overridden.logs, [])
+
+    def test_overrides_apply_to_given_options(self):
+        options = TraceOptions(tag_parameters=True)
+        traced_func = Tracing(self.tracer).trace("TestTrace", lambda x: x, options=options, parameter_prefix="p")
+
+        traced_func(1)
+
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"p.x": 1})
+
+    def test_override_with_none(self):
+        options = TraceOptions(tag_parameters=True, parameter_prefix="args")
+        traced_func = Tracing(self.tracer).trace("TestTrace", lambda x: x, options=options, parameter_prefix=None)
+
+        traced_func(1)
+
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"x": 1})
+
+    def test_trace_takes_every_option(self):
+        parameters = inspect.signature(Tracing.trace).parameters
+
+        for name in TraceOptions.__slots__:
+            if name != "records_payload":
+                self.assertIs(parameters[name].kind, inspect.Parameter.KEYWORD_ONLY)
+
+    def test_invalid_option(self):
+        self.assertRaises(TypeError, Tracing(self.tracer).trace, "TestTrace", lambda: 1, bogus=True)
@@ -0,0 +1,75 @@
+import unittest
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.background import BackgroundSerializer
+from opentracing_decorator.overhead import OverheadStats, PhaseTimings
+from opentracing_decorator.tracing import Tracing
+
+
+class TestOverheadStats(unittest.TestCase):
+    def test_record(self):
+        stats = OverheadStats(bucket_bounds_ns=(10, 100))
+        stats.record("op", {"bind": 5, "flatten": 50})
+        stats.record("op", {"bind": 500})
+
+        snapshot = stats.snapshot()
+
+        self.assertEqual(snapshot["op"]["bind"]["count"], 2)
+        self.assertEqual(snapshot["op"]["bind"]["total_ns"], 505)
+        self.assertEqual(snapshot["op"]["bind"]["buckets"], {10: 1, 100: 0, "inf": 1})
+        self.assertEqual(snapshot["op"]["flatten"]["buckets"], {10: 0, 100: 1, "inf": 0})
+
+    def test_reset(self):
+        stats = OverheadStats()
+        stats.record("op", {"bind": 5})
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_lap(self):
+        timings = PhaseTimings()
+        timings.lap("bind", timings.lap("bind", 0))
+        self.assertGreater(timings["bind"], 0)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+
+    def func(self, x):
+        return {"y": x}
+
+    def test_disabled(self):
+        tracing = Tracing(self.tracer)
+        tracing.trace("TestTrace", self.func, tag_parameters=True)(1)
+        self.assertEqual(tracing.stats(), {})
+
+    def test_phases_recorded(self):
+        tracing = Tracing(self.tracer, measure_overhead=True)
+        traced_func = tracing.trace("TestTrace", self.func, tag_parameters=True, log_return=True)
+        traced_func(1)
+        traced_func(2)
+
+        stats = tracing.stats()["TestTrace"]
+
+        self.assertEqual(set(stats), {"bind", "flatten", "convert", "set_tag", "log_kv"})
+        self.assertEqual(stats["bind"]["count"], 2)
+        self.assertEqual(stats["flatten"]["count"], 2)
+        self.assertNotIn("tracing.overhead_ns", self.tracer.finished_spans()[0].tags)
+
+    def test_overhead_tag(self):
+        tracing = Tracing(self.tracer, tag_overhead=True)
+        tracing.trace("TestTrace", self.func, tag_parameters=True)(1)
+
+        tags = self.tracer.finished_spans()[0].tags
+        self.assertGreater(tags["tracing.overhead_ns"], 0)
+
+    def test_background(self):
+        serializer = BackgroundSerializer()
+        self.addCleanup(serializer.shutdown)
+        tracing = Tracing(self.tracer, serializer=serializer, tag_overhead=True)
+        tracing.trace("TestTrace", self.func, log_return=True)(1)
+        serializer.flush()
+
+        self.assertEqual(tracing.stats()["TestTrace"]["log_kv"]["count"], 1)
+        self.assertIn("tracing.overhead_ns", self.tracer.finished_spans()[0].tags)
@@ -0,0 +1,84 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict
+
+import opentracing
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.propagation import run_with_carrier
+from opentracing_decorator.tracing import Tracing
+
+
+def use_mock_tracer():
+    opentracing.set_global_tracer(MockTracer())
+
+
+def active_parent():
+    span = opentracing.global_tracer().active_span
+    return span.context.trace_id, span.parent_id
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer)
+
+    def test_thread_pool(self):
+        with self.tracing.traced_executor(ThreadPoolExecutor(max_workers=2)) as executor:
+            with self.tracer.start_active_span("Parent") as scope:
+                futures = [executor.submit(lambda: self.tracer.active_span) for _ in range(10)]
+                results = list(executor.map(lambda _: self.tracer.active_span, range(10)))
+
+        self.assertTrue(all(future.result() is scope.span for future in futures))
+        self.assertTrue(all(result is scope.span for result in results))
+
+    def test_thread_pool_traced_children(self):
+        traced = self.tracing.trace("Child", lambda: None)
+
+        with self.tracing.traced_executor(ThreadPoolExecutor(max_workers=2)) as executor:
+            with self.tracer.start_active_span("Parent") as scope:
+                for future in [executor.submit(traced) for _ in range(5)]:
+                    future.result()
+
+        children = [span for span in self.tracer.finished_spans() if span.operation_name == "Child"]
+        self.assertEqual(len(children), 5)
+        self.assertTrue(all(child.parent_id == scope.span.context.span_id for child in children))
+
+    def test_no_active_span(self):
+        def func():
+            pass
+
+        self.assertIs(self.tracing.wrap_context(func), func)
+
+    def test_wrap_context(self):
+        with self.tracer.start_active_span("Parent") as scope:
+            wrapped = self.tracing.wrap_context(lambda: self.tracer.active_span)
+
+        self.assertIsNone(self.tracer.active_span)
+        self.assertIs(wrapped(), scope.span)
+        self.assertIsNone(self.tracer.active_span)
+
+    def test_run_with_carrier(self):
+        with self.tracer.start_active_span("Parent") as scope:
+            carrier: Dict[str, str] = {}
+            self.tracer.inject(scope.span.context, opentracing.Format.TEXT_MAP, carrier)
+
+        previous = opentracing.global_tracer()
+        opentracing.set_global_tracer(self.tracer)
+        try:
+            trace_id, parent_id = run_with_carrier(carrier, "Child", active_parent)
+        finally:
+            opentracing.set_global_tracer(previous)
+
+        self.assertEqual(trace_id, scope.span.context.trace_id)
+        self.assertEqual(parent_id, scope.span.context.span_id)
+        self.assertEqual(self.tracer.finished_spans()[-1].operation_name, "Child")
+
+    def test_process_pool(self):
+        with self.tracing.traced_executor(ProcessPoolExecutor(max_workers=1, initializer=use_mock_tracer)) as executor:
+            with self.tracer.start_active_span("Parent") as scope:
+                future = executor.submit(active_parent)
+            trace_id, parent_id = future.result()
+
+        self.assertEqual(trace_id, scope.span.context.trace_id)
+        self.assertEqual(parent_id, scope.span.context.span_id)
@@ -0,0 +1,178 @@
+import asyncio
+import contextvars
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import opentracing
+from opentracing.mocktracer import MockTracer
+from opentracing.scope_managers import ThreadLocalScopeManager
+
+from opentracing_decorator.scoping import ContextVarScopeManager
+from opentracing_decorator.tracing import Tracing
+
+
+class TestContextVarScopeManager(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer(scope_manager=ContextVarScopeManager())
+        self.scope_manager = self.tracer.scope_manager
+
+    def test_activate_and_close(self):
+        self.assertIsNone(self.scope_manager.active)
+
+        with self.tracer.start_active_span("Outer") as outer:
+            with self.tracer.start_active_span("Inner") as inner:
+                self.assertIs(self.scope_manager.active, inner)
+                self.assertEqual(inner.span.parent_id, outer.span.context.span_id)
+            self.assertIs(self.scope_manager.active, outer)
+
+        self.assertIsNone(self.scope_manager.active)
+        self.assertEqual([span.operation_name for span in self.tracer.finished_spans()], ["Inner", "Outer"])
+
+    def test_finish_on_close(self):
+        span = self.tracer.start_span("Test")
+
+        self.scope_manager.activate(span, False).close()
+
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+    def test_close_out_of_order(self):
+        outer = self.tracer.start_active_span("Outer")
+        inner = self.tracer.start_active_span("Inner")
+
+        outer.close()
+        self.assertIs(self.scope_manager.active, inner)
+        inner.close()
+
+        self.assertIs(self.scope_manager.active, outer)
+        self.assertEqual(len(self.tracer.finished_spans()), 2)
+
+    def test_close_in_other_context(self):
+        outer = self.tracer.start_active_span("Outer")
+        context = contextvars.copy_context()
+        scope = context.run(self.tracer.start_active_span, "Inner")
+
+        contextvars.copy_context().run(scope.close)
+        context.run(lambda: self.assertIs(self.scope_manager.active, scope))
+        self.assertIs(self.scope_manager.active, outer)
+        self.assertEqual(self.tracer.finished_spans()[0].operation_name, "Inner")
+
+    def test_threads_isolated(self):
+        active = []
+
+        with self.tracer.start_active_span("Test"):
+            thread = threading.Thread(target=lambda: active.append(self.scope_manager.active))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(active, [None])
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer, scope_manager=ContextVarScopeManager())
+
+        @self.tracing.trace("Child", tag_parameters=True)
+        async def child(index):
+            await asyncio.sleep(0)
+            return index
+
+        @self.tracing.trace("Parent", tag_parameters=True)
+        async def parent(index):
+            await asyncio.sleep(0)
+            await child(index)
+            await asyncio.sleep(0)
+            return await child(index)
+
+        self.parent = parent
+
+    def assert_parents(self, count, children_per_parent):
+        parents = {}
+        children = []
+        for span in self.tracer.finished_spans():
+            if span.operation_name == "Parent":
+                parents[span.context.span_id] = span
+            else:
+                children.append(span)
+
+        self.assertEqual(len(parents), count)
+        self.assertEqual(len(children), count * children_per_parent)
+        for child in children:
+            parent = parents[child.parent_id]
+            self.assertEqual(child.tags["index"], parent.tags["index"])
+            self.assertEqual(child.context.trace_id, parent.context.trace_id)
+        for parent in parents.values():
+            self.assertIsNone(parent.parent_id)
+
+    def test_scope_manager_installed(self):
+        self.assertIsInstance(self.tracer.scope_manager, ContextVarScopeManager)
+
+    def test_global_tracer_refused(self):
+        scope_manager = opentracing.tracer.scope_manager
+
+        self.assertRaises(ValueError, Tracing, scope_manager=ContextVarScopeManager())
+        self.assertIs(opentracing.tracer.scope_manager, scope_manager)
+
+    def test_fixed_scope_manager_refused(self):
+        class FixedTracer(MockTracer):
+            fixed = ThreadLocalScopeManager()
+
+            @property
+            def scope_manager(self):
+                return self.fixed
+
+        tracer = FixedTracer()
+
+        self.assertRaises(TypeError, Tracing, tracer, scope_manager=ContextVarScopeManager())
+        self.assertIs(tracer.scope_manager, FixedTracer.fixed)
+
+    def test_generator_uses_current_scope_manager(self):
+        tracer = MockTracer()
+        tracing = Tracing(tracer)
+
+        @tracing.trace("TestTrace")
+        def func():
+            yield tracer.active_span
+
+        tracing.use_scope_manager(ContextVarScopeManager())
+
+        self.assertEqual(list(func()), tracer.finished_spans())
+
+    def test_interleaved_tasks(self):
+        async def main():
+            return await asyncio.gather(*(self.parent(index) for index in range(2000)))
+
+        self.assertEqual(asyncio.run(main()), list(range(2000)))
+        self.assert_parents(2000, 2)
+
+    def test_threads(self):
+        @self.tracing.trace("Child", tag_parameters=True)
+        def child(index):
+            return index
+
+        @self.tracing.trace("Parent", tag_parameters=True)
+        def parent(index):
+            return child(index)
+
+        with ThreadPoolExecutor(8) as executor:
+            self.assertEqual(list(executor.map(parent, range(500))), list(range(500)))
+        self.assert_parents(500, 1)
+
+    def test_executor_from_task(self):
+        @self.tracing.trace("Child", tag_parameters=True)
+        def child(index):
+            return index
+
+        async def parent(index, executor):
+            with self.tracer.start_active_span("Parent") as scope:
+                scope.span.set_tag("index", index)
+                await asyncio.sleep(0)
+                return await asyncio.wrap_future(executor.submit(child, index))
+
+        async def main():
+            with self.tracing.traced_executor(ThreadPoolExecutor(4)) as executor:
+                return await asyncio.gather(*(parent(index, executor) for index in range(200)))
+
+        self.assertEqual(asyncio.run(main()), list(range(200)))
+        self.assert_parents(200, 1)
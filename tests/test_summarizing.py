@@ -0,0 +1,115 @@
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.summarizing import SummarizerRegistry
+from opentracing_decorator.tracing import Tracing
+
+
+class FakeArray:
+    def __init__(self, values, shape):
+        self.values = values
+        self.shape = shape
+        self.dtype = "float64"
+
+    @property
+    def flat(self):
+        return FakeArray(self.values, (len(self.values),))
+
+    def __getitem__(self, index):
+        return FakeArray(self.values[index], (len(self.values[index]),))
+
+    def tolist(self):
+        return list(self.values)
+
+
+def fake_numpy():
+    module = types.ModuleType("numpy")
+    setattr(module, "ndarray", FakeArray)
+    return module
+
+
+class TestSummarizerRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = SummarizerRegistry(max_items=3)
+
+    def test_small_values_unchanged(self):
+        value = [1, 2, 3]
+
+        self.assertIs(self.registry.summarize(value), value)
+        self.assertEqual(self.registry.summarize(b"abc"), b"abc")
+        self.assertEqual(self.registry.summarize("a long string"), "a long string")
+
+    def test_large_sequences(self):
+        self.assertEqual(self.registry.summarize(list(range(100))), {"type": "list", "length": 100, "head": [0, 1, 2]})
+        self.assertEqual(self.registry.summarize(tuple(range(5))), {"type": "tuple", "length": 5, "head": [0, 1, 2]})
+        self.assertEqual(self.registry.summarize(set(range(5)))["length"], 5)
+
+    def test_bytes(self):
+        self.assertEqual(self.registry.summarize(b"\x00\x01\x02\x03"), {"type": "bytes", "length": 4, "head": "000102"})
+        self.assertEqual(
+            self.registry.summarize(memoryview(b"abcd")),
+            {"type": "memoryview", "nbytes": 4, "format": "B", "shape": [4], "head": "616263"},
+        )
+
+    def test_lazy_module_not_loaded(self):
+        with patch.dict(sys.modules, {"numpy": None}):
+            array = FakeArray([1.0, 2.0], (2,))
+            self.assertIs(self.registry.summarize(array), array)
+
+    def test_lazy_module_loaded(self):
+        with patch.dict(sys.modules, {"numpy": fake_numpy()}):
+            summary = SummarizerRegistry(max_items=3).summarize(FakeArray([1.0, 2.0, 3.0, 4.0], (2, 2)))
+
+        self.assertEqual(summary, {"type": "FakeArray", "shape": [2, 2], "dtype": "float64", "head": [1.0, 2.0, 3.0]})
+
+    def test_register(self):
+        class Secret:
+            pass
+
+        self.registry.register(Secret, lambda value, max_items: "<secret>")
+
+        self.assertEqual(self.registry.summarize(Secret()), "<secret>")
+        self.assertEqual(self.registry.summarize(type("Child", (Secret,), {})()), "<secret>")
+
+    def test_invalid_max_items(self):
+        self.assertRaises(ValueError, SummarizerRegistry, 0)
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer, summarizers=SummarizerRegistry(max_items=2))
+
+    def test_parameters_summarized(self):
+        def func(rows, data):
+            pass
+
+        self.tracing.trace("TestTrace", func, tag_parameters=True)({"ids": list(range(10))}, b"0123456789")
+
+        self.assertDictEqual(
+            self.tracer.finished_spans()[0].tags,
+            {
+                "rows.ids.type": "list",
+                "rows.ids.length": 10,
+                "rows.ids.head.0": 0,
+                "rows.ids.head.1": 1,
+                "data.type": "bytes",
+                "data.length": 10,
+                "data.head": "3031",
+            },
+        )
+
+    def test_return_summarized_without_flattening(self):
+        def func():
+            return list(range(10))
+
+        self.tracing.trace("TestTrace", func, log_return=True, flatten_return=False)()
+
+        self.assertEqual(
+            self.tracer.finished_spans()[0].logs[0].key_values,
+            {"return": {"type": "list", "length": 10, "head": [0, 1]}},
+        )
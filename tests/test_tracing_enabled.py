@@ -0,0 +1,102 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import opentracing
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.tracing import ENABLED_VARIABLE, Tracing
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = MockTracer()
+        self.tracing = Tracing(self.tracer)
+
+    def test_disable_and_enable(self):
+        func = MagicMock(return_value=3)
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True)
+
+        self.tracing.disable()
+        self.assertEqual(traced_func(1), 3)
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+        self.tracing.enable()
+        traced_func(1)
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_disable_and_enable_plain(self):
+        func = MagicMock(return_value=3)
+        traced_func = self.tracing.trace("TestTrace", func)
+
+        self.tracing.disable()
+        self.assertEqual(traced_func(1), 3)
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+        self.tracing.enable()
+        traced_func(1)
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_disabled_passes_noop_span(self):
+        func = MagicMock()
+        traced_func = self.tracing.trace("TestTrace", func, pass_span=True)
+
+        self.tracing.disable()
+        traced_func()
+
+        self.assertIs(type(func.call_args[1]["span"]), opentracing.Span)
+
+    def test_disabled_async(self):
+        async def func(x):
+            return x
+
+        traced_func = self.tracing.trace("TestTrace", func)
+        self.tracing.disable()
+
+        self.assertEqual(asyncio.run(traced_func(2)), 2)
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+    def test_disabled_generator(self):
+        def func():
+            received = yield 1
+            yield received
+
+        traced_func = self.tracing.trace("TestTrace", func)
+        self.tracing.disable()
+
+        generator = traced_func()
+        self.assertEqual(next(generator), 1)
+        self.assertEqual(generator.send(5), 5)
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+    def test_disabled_async_generator(self):
+        async def func():
+            received = yield 1
+            yield received
+
+        async def consume(generator):
+            return [await generator.asend(None), await generator.asend(5)]
+
+        traced_func = self.tracing.trace("TestTrace", func)
+        self.tracing.disable()
+
+        self.assertEqual(asyncio.run(consume(traced_func())), [1, 5])
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+    def test_environment_variable(self):
+        with patch.dict(os.environ, {ENABLED_VARIABLE: "false"}):
+            self.assertFalse(Tracing(self.tracer).enabled)
+            self.assertTrue(Tracing(self.tracer, enabled=True).enabled)
+        with patch.dict(os.environ, {ENABLED_VARIABLE: "1"}):
+            self.assertTrue(Tracing(self.tracer).enabled)
+
+    def test_remove_when_disabled(self):
+        def func():
+            pass
+
+        tracing = Tracing(self.tracer, enabled=False, remove_when_disabled=True)
+
+        self.assertIs(tracing.trace("TestTrace", func), func)
+        self.assertIsNot(tracing.trace("TestTrace", func, pass_span=True), func)
+        self.assertIsNot(self.tracing.trace("TestTrace", func), func)
@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import MagicMock
+
+import opentracing
+from opentracing.mocktracer import MockTracer
+
+from opentracing_decorator.tracing import span_is_recording
+
+
+class TestTracing(unittest.TestCase):
+    def test_noop_span(self):
+        span = opentracing.Tracer().start_span("TestSpan")
+        self.assertFalse(span_is_recording(span))
+
+    def test_mock_span(self):
+        span = MockTracer().start_span("TestSpan")
+        self.assertTrue(span_is_recording(span))
+
+    def test_is_sampled(self):
+        span = MagicMock(spec=["is_sampled", "context"])
+        span.is_sampled.return_value = False
+        self.assertFalse(span_is_recording(span))
+
+    def test_context_sampled(self):
+        span = MagicMock(spec=["context"])
+        span.context.sampled = False
+        self.assertFalse(span_is_recording(span))
@@ -1,10 +1,16 @@
+import asyncio
+import functools
+import inspect
 import numbers
+import time
 import unittest
 import uuid
-from unittest.mock import MagicMock, create_autospec
+from unittest.mock import MagicMock, create_autospec, patch
 
+import opentracing
 from opentracing.mocktracer import MockTracer
 
+from opentracing_decorator.caching import PayloadCache
 from opentracing_decorator.tracing import Tracing
 
 
@@ -54,6 +60,41 @@ class TestTracing(unittest.TestCase):
 
         self.assertDictEqual(correct, span_tags)
 
+    def test_selected_parameters_tagged(self):
+        def func(user_id, order, request):
+            pass
+
+        request = MagicMock()
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=["user_id", "order.id", "order.missing"])
+
+        traced_func(1, {"id": 2, "lines": [1, 2, 3]}, request)
+
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"user_id": 1, "order.id": 2})
+        self.assertEqual(request.mock_calls, [])
+
+    def test_excluded_parameters_not_tagged(self):
+        def func(user_id, password):
+            pass
+
+        traced_func = self.tracing.trace("TestTrace", func, tag_parameters=True, exclude_parameters=["password"])
+
+        traced_func(1, "secret")
+
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"user_id": 1})
+
+    def test_operation_name_template(self):
+        def func(event):
+            pass
+
+        traced_func = self.tracing.trace("handle:{event.type}", func, max_operation_names=1)
+
+        traced_func({"type": "created"})
+        traced_func({"type": "deleted"})
+        traced_func({})
+
+        names = [span.operation_name for span in self.tracer.finished_spans()]
+        self.assertEqual(names, ["handle:created", "handle:{event.type}", "handle:{event.type}"])
+
     def test_parameters_tagged_with_prefix(self):
         def func_signature(a, b, c):
             pass
@@ -196,3 +237,249 @@ class TestTracing(unittest.TestCase):
 
         correct = {f"return.{str(test_object)}": "Hello"}
         self.assertDictEqual(correct, logs[0].key_values)
+
+    def test_async_function_traced(self):
+        async def func(x):
+            await asyncio.sleep(0.01)
+            return x
+
+        traced_func = self.tracing.trace("TestTrace", func, log_return=True)
+        self.assertTrue(inspect.iscoroutinefunction(traced_func))
+
+        result = asyncio.run(traced_func(3))
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(result, 3)
+        self.assertGreaterEqual(span.finish_time - span.start_time, 0.01)
+        self.assertDictEqual({"return": 3}, span.logs[0].key_values)
+
+    def test_async_partial_traced(self):
+        async def func(x):
+            await asyncio.sleep(0.01)
+            return x
+
+        traced_func = self.tracing.trace("TestTrace", functools.partial(func, 3), log_return=True)
+
+        self.assertEqual(asyncio.run(traced_func()), 3)
+
+        span = self.tracer.finished_spans()[0]
+        self.assertGreaterEqual(span.finish_time - span.start_time, 0.01)
+        self.assertDictEqual({"return": 3}, span.logs[0].key_values)
+
+    def test_async_parameters_tagged(self):
+        async def func(a, b, span):
+            return span
+
+        traced_func = self.tracing.trace("TestTrace", func, pass_span=True, tag_parameters=True)
+
+        span = asyncio.run(traced_func(1, b=2))
+
+        self.assertIs(span, self.tracer.finished_spans()[0])
+        self.assertEqual(span.tags["a"], 1)
+        self.assertEqual(span.tags["b"], 2)
+
+    def test_async_exception(self):
+        async def func():
+            raise ValueError()
+
+        traced_func = self.tracing.trace("TestTrace", func)
+
+        self.assertRaises(ValueError, asyncio.run, traced_func())
+        self.assertEqual(len(self.tracer.finished_spans()), 1)
+
+    def test_generator_span_covers_consumption(self):
+        def func(n):
+            for i in range(n):
+                yield i
+
+        traced_func = self.tracing.trace("TestTrace", func)
+        generator = traced_func(3)
+
+        self.assertEqual(next(generator), 0)
+        self.assertEqual(len(self.tracer.finished_spans()), 0)
+        self.assertEqual(list(generator), [1, 2])
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags["generator.items"], 3)
+        self.assertIn("generator.time_to_first_item", span.tags)
+
+    def test_generator_span_active_while_running(self):
+        def func():
+            yield self.tracer.active_span
+
+        traced_func = self.tracing.trace("TestTrace", func)
+        active_spans = list(traced_func())
+
+        self.assertIs(active_spans[0], self.tracer.finished_spans()[0])
+        self.assertIsNone(self.tracer.active_span)
+
+    def test_generator_closed(self):
+        def func():
+            yield 1
+            yield 2
+
+        generator = self.tracing.trace("TestTrace", func)()
+        next(generator)
+        generator.close()
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags["generator.items"], 1)
+        self.assertNotIn("error", span.tags)
+
+    def test_generator_send_and_return(self):
+        def func():
+            received = yield 1
+            return received
+
+        generator = self.tracing.trace("TestTrace", func)()
+        next(generator)
+
+        with self.assertRaises(StopIteration) as stop:
+            generator.send(5)
+        self.assertEqual(stop.exception.value, 5)
+
+    def test_generator_exception(self):
+        def func():
+            yield 1
+            raise ValueError()
+
+        traced_func = self.tracing.trace("TestTrace", func)
+
+        self.assertRaises(ValueError, list, traced_func())
+        self.assertTrue(self.tracer.finished_spans()[0].tags["error"])
+
+    def test_generator_log_batches(self):
+        def func(n):
+            yield from range(n)
+
+        traced_func = self.tracing.trace("TestTrace", func, log_return=True, yield_batch_size=2, yield_sample_every=2)
+        list(traced_func(7))
+
+        logs = [log.key_values for log in self.tracer.finished_spans()[0].logs]
+        self.assertEqual(logs, [{"return.0": 0, "return.2": 2}, {"return.4": 4, "return.6": 6}])
+
+    def test_async_generator_traced(self):
+        async def func(n):
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+
+        async def consume(generator):
+            return [item async for item in generator]
+
+        traced_func = self.tracing.trace("TestTrace", func, log_return=True)
+        self.assertTrue(inspect.isasyncgenfunction(traced_func))
+
+        self.assertEqual(asyncio.run(consume(traced_func(3))), [0, 1, 2])
+
+        span = self.tracer.finished_spans()[0]
+        self.assertEqual(span.tags["generator.items"], 3)
+        self.assertDictEqual(span.logs[0].key_values, {"return.0": 0, "return.1": 1, "return.2": 2})
+
+    def test_invalid_yield_options(self):
+        self.assertRaises(ValueError, self.tracing.trace, "TestTrace", MagicMock(), yield_batch_size=0)
+
+    def test_unsampled_span_skips_tags_and_logs(self):
+        tracing = Tracing(self.tracer, is_recording=lambda span: False)
+        binder = MagicMock()
+        func = MagicMock(return_value=3)
+
+        with patch("opentracing_decorator.binding.ParameterBinder", return_value=binder):
+            traced_func = tracing.trace("TestTrace", func, tag_parameters=True, log_return=True)
+        traced_func(1, 2)
+
+        span = self.tracer.finished_spans()[0]
+        binder.assert_not_called()
+        self.assertDictEqual(span.tags, {})
+        self.assertEqual(span.logs, [])
+
+    def test_noop_tracer_short_circuits(self):
+        tracer = opentracing.Tracer()
+        tracer.start_active_span = MagicMock()
+        func = MagicMock(return_value=3)
+        traced_func = Tracing(tracer).trace("TestTrace", func, pass_span=True, tag_parameters=True)
+
+        self.assertEqual(traced_func(1), 3)
+
+        tracer.start_active_span.assert_not_called()
+        self.assertIs(type(func.call_args[1]["span"]), opentracing.Span)
+
+    def test_child_tags_passed_at_start(self):
+        traced_func = self.tracing.trace("TestTrace", lambda x: x, tag_parameters=True, parameter_prefix="args")
+        start_active_span = MagicMock(wraps=self.tracer.start_active_span)
+
+        with self.tracer.start_active_span("Parent"), patch.object(self.tracer, "start_active_span", start_active_span):
+            started = time.time()
+            traced_func(1)
+
+        child = self.tracer.finished_spans()[0]
+        self.assertDictEqual(start_active_span.call_args[1]["tags"], {"args.x": 1})
+        self.assertDictEqual(child.tags, {"args.x": 1})
+        self.assertGreaterEqual(child.start_time, started)
+
+    def test_root_tags_set_after_start(self):
+        traced_func = self.tracing.trace("TestTrace", lambda x: x, tag_parameters=True)
+        start_active_span = MagicMock(wraps=self.tracer.start_active_span)
+
+        with patch.object(self.tracer, "start_active_span", start_active_span):
+            traced_func(1)
+
+        self.assertNotIn("tags", start_active_span.call_args[1])
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"x": 1})
+
+    def test_tags_at_start(self):
+        traced_func = self.tracing.trace("TestTrace", lambda x: x, tag_parameters=True, tags_at_start=True)
+        start_active_span = MagicMock(wraps=self.tracer.start_active_span)
+
+        with patch.object(self.tracer, "start_active_span", start_active_span):
+            traced_func(1)
+
+        self.assertDictEqual(start_active_span.call_args[1]["tags"], {"x": 1})
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"x": 1})
+
+    def test_unsampled_parent_tags_after_start(self):
+        tracing = Tracing(self.tracer, is_recording=lambda span: span.operation_name != "Parent")
+        traced_func = tracing.trace("TestTrace", lambda x: x, tag_parameters=True)
+        start_active_span = MagicMock(wraps=self.tracer.start_active_span)
+
+        with self.tracer.start_active_span("Parent"), patch.object(self.tracer, "start_active_span", start_active_span):
+            traced_func(1)
+
+        self.assertNotIn("tags", start_active_span.call_args[1])
+        self.assertDictEqual(self.tracer.finished_spans()[0].tags, {"x": 1})
+
+    def test_pass_span_tags_at_start(self):
+        @self.tracing.trace("TestTrace", pass_span=True, tag_parameters=True)
+        def func(x, span):
+            return span
+
+        with self.tracer.start_active_span("Parent"):
+            span = func(1)
+
+        self.assertIs(span, self.tracer.finished_spans()[0])
+        self.assertDictEqual(span.tags, {"x": 1})
+
+    def test_tags_at_start_binding_error(self):
+        traced_func = self.tracing.trace("TestTrace", lambda x: x, tag_parameters=True, tags_at_start=True)
+
+        self.assertRaises(TypeError, traced_func, 1, 2)
+
+        span = self.tracer.finished_spans()[0]
+        self.assertTrue(span.tags["error"])
+
+    def test_tags_at_start_cached_payload_copied(self):
+        cache = PayloadCache()
+        tracing = Tracing(self.tracer, payload_cache=cache)
+
+        @tracing.trace("TestTrace", tag_parameters=True, tags_at_start=True)
+        def func(x):
+            if x:
+                raise ValueError()
+
+        self.assertRaises(ValueError, func, 1)
+        self.assertRaises(ValueError, func, 1)
+
+        first, second = self.tracer.finished_spans()
+        self.assertEqual(cache.hits, 1)
+        self.assertIsNot(first.tags, second.tags)
+        self.assertDictEqual(second.tags, first.tags)